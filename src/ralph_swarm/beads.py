@@ -0,0 +1,119 @@
+"""Shared access to the beads (bd) CLI."""
+
+import functools
+import subprocess
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson as _json
+except ImportError:  # No orjson wheel for this platform; stdlib json also takes bytes
+    import json as _json
+
+READ_CACHE_TTL = 1.0
+
+
+def parse_json(data: bytes | str) -> Any:
+    """Parse bd JSON output. Returns None if it isn't valid JSON."""
+    try:
+        return _json.loads(data)
+    except _json.JSONDecodeError:
+        return None
+
+
+class BeadsClient:
+    """Thin wrapper around the bd CLI for one project directory.
+
+    Read queries are cached for ``ttl`` seconds so that callers polling the
+    same query in quick succession share a single bd invocation. Any write
+    through the client drops the cache.
+    """
+
+    def __init__(self, cwd: Path, ttl: float = READ_CACHE_TTL) -> None:
+        self.cwd = cwd
+        self.ttl = ttl
+        self._cache: dict[tuple[str, ...], tuple[float, Any]] = {}
+
+    def _query(self, *args: str) -> Any:
+        """Run a bd command returning JSON. Returns None on failure."""
+        cached = self._cache.get(args)
+        if cached and time.monotonic() - cached[0] < self.ttl:
+            return cached[1]
+
+        result = subprocess.run(  # noqa: S603
+            ["bd", *args, "--json"],
+            capture_output=True,
+            cwd=self.cwd,
+        )
+        if result.returncode != 0:
+            return None
+
+        # Parse the raw bytes directly; no intermediate str decode
+        data = parse_json(result.stdout)
+        if data is None:
+            return None
+
+        self._cache[args] = (time.monotonic(), data)
+        return data
+
+    def ready(self, unassigned: bool = False) -> list[dict] | None:
+        """Issues that are ready to work on, optionally only unassigned ones."""
+        if unassigned:
+            return self._query("ready", "--unassigned")
+        return self._query("ready")
+
+    def list(self, status: str | None = None) -> list[dict] | None:
+        """Issues, optionally filtered by status."""
+        if status:
+            return self._query("list", "--status", status)
+        return self._query("list")
+
+    def show(self, issue_id: str) -> dict:
+        """A single issue, or an empty dict if it can't be read."""
+        data = self._query("show", issue_id)
+        # bd show may return a list or a dict
+        if isinstance(data, list):
+            data = data[0] if data else {}
+        return data or {}
+
+    def update(self, *args: str) -> bool:
+        """Run ``bd update`` with the given arguments. Returns True on success."""
+        result = subprocess.run(  # noqa: S603, S607
+            ["bd", "update", *args],
+            capture_output=True,
+            cwd=self.cwd,
+        )
+        self.invalidate()
+        return result.returncode == 0
+
+    def invalidate(self) -> None:
+        """Drop cached query results."""
+        self._cache.clear()
+
+
+@functools.cache
+def get_client(cwd: Path) -> BeadsClient:
+    """Return the shared client for a project directory."""
+    return BeadsClient(cwd)
+
+
+def get_beads_summary(cwd: Path) -> dict[str, int]:
+    """Get a summary of current beads issues."""
+    result = subprocess.run(  # noqa: S603, S607
+        ["bd", "list", "--json"],
+        capture_output=True,
+        cwd=cwd,
+    )
+    issues = parse_json(result.stdout) if result.returncode == 0 else None
+    if issues is None:
+        return {}
+
+    counts = Counter(issue.get("status", "open") for issue in issues)
+    return {
+        "total": len(issues),
+        "open": counts["open"],
+        "in_progress": counts["in_progress"],
+        "closed": counts["closed"],
+    }
@@ -1,16 +1,22 @@
 """Ralph Swarm CLI - Main entry point."""
 
+from pathlib import Path
+
 import click
-from rich.console import Console
 
 from ralph_swarm.commands import build, cleanup, init, plan, research, specify, status
 
-console = Console()
-
 
 @click.group()
 @click.version_option()
-def main() -> None:
+@click.option(
+    "--project-dir",
+    "-C",
+    type=click.Path(exists=True, file_okay=False, resolve_path=True, path_type=Path),
+    envvar="RALPH_SWARM_PROJECT",
+    help="Project directory to operate on (default: current directory)",
+)
+def main(project_dir: Path | None) -> None:
     """Ralph Swarm - AI-powered autonomous development orchestrator.
 
     Phases:
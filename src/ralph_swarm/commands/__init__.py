@@ -1 +1,52 @@
 """Ralph Swarm commands."""
+
+import os
+import re
+import subprocess
+from pathlib import Path
+
+import click
+
+BD_ACTOR_RE = re.compile(r"BD_ACTOR=(\S+)")
+
+
+def get_project_dir() -> Path:
+    """The project directory given to the CLI, or the working directory."""
+    ctx = click.get_current_context(silent=True)
+    project_dir = ctx.find_root().params.get("project_dir") if ctx else None
+    return project_dir or Path.cwd()
+
+
+def get_running_workers(proc: str = "/proc") -> set[str] | None:
+    """Get the IDs of all workers with a running process.
+
+    Workers run claude with BD_ACTOR set in its environment. On Linux the
+    environments are read straight from /proc in one pass; elsewhere they come
+    from a single ps call. Returns None if process environments can't be read.
+    """
+    if not os.path.isdir(proc):
+        # BSD/macOS ps appends each process's environment with -E
+        result = subprocess.run(  # noqa: S603, S607
+            ["ps", "-E", "-ww", "-ax", "-o", "command="],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            return None
+        return set(BD_ACTOR_RE.findall(result.stdout))
+
+    workers = set()
+    with os.scandir(proc) as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(os.path.join(entry.path, "environ"), "rb") as f:
+                    environ = f.read()
+            except OSError:
+                continue  # Exited, or owned by another user
+            for var in environ.split(b"\0"):
+                if var.startswith(b"BD_ACTOR="):
+                    workers.add(var[len(b"BD_ACTOR=") :].decode(errors="replace"))
+                    break
+    return workers
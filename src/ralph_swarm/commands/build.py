@@ -1,14 +1,21 @@
 """Build command - Build mode with worker swarm support."""
 
 import contextlib
-import json
+import functools
+import multiprocessing
 import os
+import queue
+import random
 import signal
 import subprocess
 import sys
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from datetime import datetime
+from multiprocessing.queues import Queue
 from pathlib import Path
+from string import Template
+from typing import TextIO
 
 import click
 from rich.console import Console
@@ -16,9 +23,30 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+from ralph_swarm.beads import get_client
+from ralph_swarm.commands import get_project_dir
 from ralph_swarm.prompts import load_prompt_with_vars
+from ralph_swarm.ui import console
 
-console = Console()
+_HEADER_BAR = "=" * 60
+
+_ASSIGNED_ISSUE_TMPL = Template(
+    "\n\n**ASSIGNED ISSUE:** ${issue_id}\n"
+    "You have already been assigned issue ${issue_id}. "
+    "Run `bd show ${issue_id}` to see details and implement it.\n"
+    "Skip the claiming step - proceed directly to implementation."
+)
+
+# Worker loop pacing (seconds between iteration starts)
+ACTIVE_INTERVAL = 2.0
+IDLE_INTERVAL = 5.0
+MAX_IDLE_INTERVAL = 30.0
+
+# How often the swarm monitor re-checks the work queue
+MONITOR_INTERVAL = 10.0
+
+# Seconds to wait for each swarm worker to start and report its pid
+WORKER_START_TIMEOUT = 30.0
 
 
 def create_worktree(base_dir: Path, worker_id: str) -> Path:
@@ -86,40 +114,74 @@ def cleanup_worktrees(base_dir: Path) -> None:
         worktree_base.rmdir()
 
 
+@functools.lru_cache(maxsize=32)
+def _base_worker_prompt(worker_id: str) -> str:
+    """The build prompt for a worker, before any issue assignment."""
+    return load_prompt_with_vars("system/build", worker_id=worker_id)
+
+
 def get_worker_prompt(worker_id: str, issue_id: str | None = None) -> str:
-    """Generate worker-specific prompt."""
-    prompt = load_prompt_with_vars("system/build", worker_id=worker_id)
+    """Generate worker-specific prompt.
+
+    Only the issue-independent part is memoized; each issue is claimed once,
+    so caching the full prompt would just grow with every issue worked.
+    """
+    prompt = _base_worker_prompt(worker_id)
     if issue_id:
-        prompt += (
-            f"\n\n**ASSIGNED ISSUE:** {issue_id}\n"
-            f"You have already been assigned issue {issue_id}. "
-            f"Run `bd show {issue_id}` to see details and implement it.\n"
-            "Skip the claiming step - proceed directly to implementation."
-        )
+        prompt += _ASSIGNED_ISSUE_TMPL.substitute(issue_id=issue_id)
     return prompt
 
 
 def get_work_status(cwd: Path) -> dict:
     """Get current work status from beads."""
-    result = subprocess.run(  # noqa: S603, S607
-        ["bd", "ready", "--json"],
-        capture_output=True,
-        text=True,
-        cwd=cwd,
-    )
-    if result.returncode != 0:
+    issues = get_client(cwd).ready()
+    if issues is None:
         return {"total": 0, "unassigned": 0, "issues": []}
 
-    try:
-        issues = json.loads(result.stdout)
-        unassigned = [i for i in issues if not i.get("assignee")]
-        return {
-            "total": len(issues),
-            "unassigned": len(unassigned),
-            "issues": issues,
-        }
-    except (json.JSONDecodeError, KeyError):
-        return {"total": 0, "unassigned": 0, "issues": []}
+    unassigned = [i for i in issues if not i.get("assignee")]
+    return {
+        "total": len(issues),
+        "unassigned": len(unassigned),
+        "issues": issues,
+    }
+
+
+def claim_next_issue(cwd: Path, worker_id: str) -> tuple[str | None, bool]:
+    """Claim the next unassigned ready issue for a worker.
+
+    bd has no compare-and-swap claim, so each claim is written and then read
+    back. A worker that loses the race for one issue moves straight on to the
+    next candidate from the same ready snapshot instead of re-polling.
+
+    Returns ``(issue_id, contended)``: the claimed issue ID or None, and
+    whether any claim was lost to another worker. ``(None, True)`` means
+    there was work but every candidate was taken first.
+    """
+    client = get_client(cwd)
+    contended = False
+    for issue in client.ready(unassigned=True) or []:
+        if issue.get("assignee"):
+            continue
+
+        issue_id = issue["id"]
+        console.print(f"Attempting to claim issue {issue_id}...")
+        client.update(issue_id, "--status", "in_progress", "--assignee", worker_id)
+
+        claimed_by = client.show(issue_id).get("assignee")
+        if claimed_by == worker_id:
+            console.print(f"[green]Successfully claimed {issue_id}[/green]")
+            return issue_id, contended
+
+        console.print(f"[yellow]Failed to claim {issue_id} (claimed by {claimed_by})[/yellow]")
+        contended = True
+
+    return None, contended
+
+
+def worker_env(worker_id: str) -> dict[str, str]:
+    """Environment for a worker's claude process."""
+    # Set BD_ACTOR environment for atomic claims
+    return {**os.environ, "BD_ACTOR": worker_id}
 
 
 def run_single_worker(
@@ -127,16 +189,23 @@ def run_single_worker(
     model: str,
     verbose: bool,
     cwd: Path,
-    log_file: Path | None = None,
+    log_file: TextIO | None = None,
     issue_id: str | None = None,
+    env: dict[str, str] | None = None,
 ) -> int:
-    """Run a single worker iteration. Returns: 0=no work, 1=worked, 2=error."""
-    prompt = get_worker_prompt(worker_id, issue_id)
+    """Run a single worker iteration. Returns: 0=no work, 1=worked, 2=error.
 
-    # Set BD_ACTOR environment for atomic claims
-    env = os.environ.copy()
-    env["BD_ACTOR"] = worker_id
+    ``log_file`` is an open file owned by the caller; Claude's output is
+    appended to it. ``env`` is the worker environment from
+    ``worker_env``; it's built here if not given.
+    """
+    prompt = get_worker_prompt(worker_id, issue_id)
+    if env is None:
+        env = worker_env(worker_id)
 
+    # Each issue gets a fresh claude process on purpose: a long-lived session
+    # would carry one issue's context into the next. Worker processes
+    # themselves stay resident across iterations.
     cmd = [
         "claude",
         "--dangerously-skip-permissions",
@@ -148,20 +217,24 @@ def run_single_worker(
 
     try:
         if log_file:
-            with open(log_file, "a") as f:
-                f.write(f"\n{'=' * 60}\n")
-                f.write(f"Worker: {worker_id} | Time: {datetime.now().isoformat()}\n")
-                f.write(f"{'=' * 60}\n\n")
-
-                result = subprocess.run(  # noqa: S603
-                    cmd,
-                    input=prompt,
-                    stdout=f,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    cwd=cwd,
-                    env=env,
-                )
+            log_file.write(
+                f"\n{_HEADER_BAR}\n"
+                f"Worker: {worker_id} | Time: {datetime.now().isoformat(timespec='seconds')}\n"
+                f"{_HEADER_BAR}\n\n"
+            )
+            # Claude writes straight to the file descriptor, so the header has
+            # to leave our buffer first
+            log_file.flush()
+
+            result = subprocess.run(  # noqa: S603
+                cmd,
+                input=prompt,
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+                text=True,
+                cwd=cwd,
+                env=env,
+            )
         elif verbose:
             process = subprocess.Popen(  # noqa: S603
                 cmd,
@@ -235,7 +308,7 @@ def build_cmd(
     This phase picks up issues from beads and implements them.
     Use multiple workers for parallel development.
     """
-    cwd = Path.cwd()
+    cwd = get_project_dir()
 
     # Check for required files
     if not (cwd / "CLAUDE.md").exists():
@@ -323,6 +396,24 @@ def build_cmd(
             cleanup_worktrees(cwd)
 
 
+def _pace(start: float, interval: float) -> None:
+    """Sleep until ``interval`` seconds after ``start`` (a monotonic time)."""
+    remaining = interval - (time.monotonic() - start)
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+def _jittered(base: float) -> float:
+    """Add up to 50% random jitter so swarm workers don't poll bd in lockstep."""
+    return base + random.uniform(0, base / 2)  # noqa: S311
+
+
+def _idle_interval(idle_count: int) -> float:
+    """Jittered exponential backoff for idle polls, never above MAX_IDLE_INTERVAL."""
+    # Cap the exponent so long idle stretches can't overflow the float conversion
+    return min(_jittered(IDLE_INTERVAL * 2 ** min(idle_count - 1, 8)), MAX_IDLE_INTERVAL)
+
+
 def run_single_worker_loop(
     worker_id: str,
     model: str,
@@ -335,9 +426,6 @@ def run_single_worker_loop(
     use_worktree: bool = False,
 ) -> None:
     """Run single worker in a loop."""
-    iteration = 1
-    idle_count = 0
-
     # Create worktree if requested
     if use_worktree:
         work_dir = create_worktree(cwd, worker_id)
@@ -348,101 +436,125 @@ def run_single_worker_loop(
     console.print(f"[green]Starting worker {worker_id}...[/green]")
     console.print("[dim]Press Ctrl+C to stop[/dim]\n")
 
-    try:
-        while True:
-            console.print(
-                f"[bold]Iteration {iteration}[/bold] - {datetime.now().strftime('%H:%M:%S')}"
-            )
-
-            # Check for available work
-            status = get_work_status(work_dir)
-            if status["unassigned"] == 0:
-                idle_count += 1
-                console.print(
-                    f"[yellow]No unassigned work (idle: {idle_count}/{idle_limit})[/yellow]"
-                )
+    iteration = 1
+    idle_count = 0
+    env = worker_env(worker_id)
 
-                if auto_shutdown and idle_count >= idle_limit:
-                    console.print("[green]Auto-shutdown: no work remaining[/green]")
+    with contextlib.ExitStack() as stack:
+        log = None
+        if log_file:
+            log = stack.enter_context(open(log_file, "a", buffering=1 << 16))
+
+        try:
+            while True:
+                t0 = time.monotonic()
+                console.print(f"[bold]Iteration {iteration}[/bold] - {time.strftime('%H:%M:%S')}")
+
+                issue_id, contended = claim_next_issue(work_dir, worker_id)
+                if issue_id is None and contended:
+                    # Work is still queued; retry soon without counting as idle
+                    idle_count = 0
+                    _pace(t0, _jittered(ACTIVE_INTERVAL))
+                    if once:
+                        break
+                    iteration += 1
+                    continue
+
+                if issue_id is None:
+                    idle_count += 1
+                    console.print(
+                        f"[yellow]No unassigned work (idle: {idle_count}/{idle_limit})[/yellow]"
+                    )
+
+                    if auto_shutdown and idle_count >= idle_limit:
+                        console.print("[green]Auto-shutdown: no work remaining[/green]")
+                        break
+
+                    # Back off while idle to ease polling pressure on bd
+                    _pace(t0, _idle_interval(idle_count))
+                    if once:
+                        break
+                    iteration += 1
+                    continue
+
+                # Reset idle count and do work
+                idle_count = 0
+                result = run_single_worker(worker_id, model, verbose, work_dir, log, issue_id, env)
+
+                if result == 2:
+                    console.print("[red]Worker encountered error[/red]")
                     break
 
-                time.sleep(5)
                 if once:
                     break
+
                 iteration += 1
-                continue
-
-            # Pick first unassigned issue (prioritized by beads)
-            unassigned_issues = [i for i in status["issues"] if not i.get("assignee")]
-            if not unassigned_issues:
-                idle_count += 1
-                console.print(
-                    f"[yellow]No unassigned issues found (idle: {idle_count}/{idle_limit})[/yellow]"
-                )
+                _pace(t0, _jittered(ACTIVE_INTERVAL))
 
-                if auto_shutdown and idle_count >= idle_limit:
-                    console.print("[green]Auto-shutdown: no work remaining[/green]")
-                    break
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Interrupted by user[/yellow]")
 
-                time.sleep(5)
-                iteration += 1
-                continue
 
-            issue_id = unassigned_issues[0]["id"]
+def _run_swarm_worker(
+    worker_id: str,
+    model: str,
+    verbose: bool,
+    auto_shutdown: bool,
+    idle_limit: int,
+    work_dir: Path,
+    log_path: Path,
+) -> None:
+    """Swarm worker process entry point.
 
-            # Atomically claim the issue
-            console.print(f"Attempting to claim issue {issue_id}...")
-            subprocess.run(  # noqa: S603, S607
-                ["bd", "update", issue_id, "--status", "in_progress", "--assignee", worker_id],
-                capture_output=True,
-                text=True,
-                cwd=work_dir,
-            )
+    Runs the normal worker loop with this process's console output
+    redirected to the worker's log file.
+    """
+    global console
+
+    with open(log_path, "a") as log:
+        console = Console(file=log)
+        run_single_worker_loop(
+            worker_id=worker_id,
+            model=model,
+            verbose=verbose,
+            once=False,
+            auto_shutdown=auto_shutdown,
+            idle_limit=idle_limit,
+            cwd=work_dir,
+            log_file=log_path,
+        )
 
-            # Verify claim succeeded
-            verify_result = subprocess.run(  # noqa: S603, S607
-                ["bd", "show", issue_id, "--json"],
-                capture_output=True,
-                text=True,
-                cwd=work_dir,
-            )
 
-            try:
-                issue_data = json.loads(verify_result.stdout)
-                # bd show may return a list or a dict
-                if isinstance(issue_data, list):
-                    issue_data = issue_data[0] if issue_data else {}
-                claimed_by = issue_data.get("assignee")
-            except (json.JSONDecodeError, KeyError, IndexError):
-                claimed_by = None
-
-            if claimed_by != worker_id:
-                console.print(
-                    f"[yellow]Failed to claim {issue_id} "
-                    f"(claimed by {claimed_by}), retrying...[/yellow]"
-                )
-                time.sleep(1)
-                iteration += 1
-                continue
+def _signal_group(pgid: int, sig: int) -> bool:
+    """Send a signal to a process group. Returns False if the group is gone."""
+    try:
+        os.killpg(pgid, sig)
+    except ProcessLookupError:
+        return False
+    return True
 
-            console.print(f"[green]Successfully claimed {issue_id}[/green]")
 
-            # Reset idle count and do work
-            idle_count = 0
-            result = run_single_worker(worker_id, model, verbose, work_dir, log_file, issue_id)
+def _init_swarm_worker(pids: Queue) -> None:
+    """Put a pool worker in its own session and report its pid (now also its pgid)."""
+    os.setsid()
+    pids.put(os.getpid())
 
-            if result == 2:
-                console.print("[red]Worker encountered error[/red]")
-                break
 
-            if once:
-                break
+def stop_workers(pgids: list[int], timeout: float = 5.0) -> None:
+    """Stop swarm workers together with the bd/claude processes they spawned.
 
-            iteration += 1
-            time.sleep(2)
+    Each worker leads its own process group, so a single killpg reaches the
+    whole subtree. Groups still alive after ``timeout`` seconds get SIGKILL.
+    """
+    pending = [pgid for pgid in pgids if _signal_group(pgid, signal.SIGTERM)]
+    deadline = time.monotonic() + timeout
+    while pending and time.monotonic() < deadline:
+        time.sleep(0.1)
+        multiprocessing.active_children()  # Reap exited workers so they don't keep the group alive
+        pending = [pgid for pgid in pending if _signal_group(pgid, 0)]
 
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Interrupted by user[/yellow]")
+    for pgid in pending:
+        _signal_group(pgid, signal.SIGKILL)
 
 
 def run_swarm(
@@ -459,9 +571,6 @@ def run_swarm(
     console.print(f"[green]Spawning {workers} workers...[/green]")
     console.print("[dim]Press Ctrl+C to stop all workers[/dim]\n")
 
-    processes: list[subprocess.Popen] = []
-    worker_scripts: list[Path] = []
-
     # Create worktrees if requested
     if use_worktrees:
         for i in range(1, workers + 1):
@@ -469,110 +578,39 @@ def run_swarm(
             worktree_dir = create_worktree(cwd, worker_id)
             console.print(f"[green]  Created worktree for {worker_id}: {worktree_dir}[/green]")
 
-    # Create worker scripts
-    verbose_flags = " --output-format stream-json --verbose" if verbose else ""
+    # Start workers
+    # Each worker gets its own session so shutdown can kill its whole subtree
+    worker_pids: Queue = multiprocessing.Queue()
+    executor = ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_swarm_worker, initargs=(worker_pids,)
+    )
+    futures: list[Future] = []
     for i in range(1, workers + 1):
         worker_id = f"ralph-{i}"
-        script_path = log_dir / f"worker-{i}.sh"
-        log_path = log_dir / f"ralph-{i}.log"
-
-        # Determine working directory
         work_dir = cwd / ".ralph-worktrees" / worker_id if use_worktrees else cwd
-
-        script_content = f"""#!/bin/bash
-export BD_ACTOR="{worker_id}"
-cd "{work_dir}"
-
-# Random initial delay to reduce startup contention (0-3 seconds)
-sleep $((RANDOM % 4))
-
-iteration=1
-idle_count=0
-
-while true; do
-    echo "=== Iteration $iteration - $(date) ===" >> "{log_path}"
-
-    # Get unassigned issues as JSON
-    unassigned_json=$(bd ready --unassigned --json 2>/dev/null)
-    unassigned_count=$(echo "$unassigned_json" | jq 'length' 2>/dev/null || echo "0")
-
-    if [ "$unassigned_count" -eq 0 ]; then
-        ((idle_count++))
-        echo "No unassigned work (idle: $idle_count/{idle_limit})" >> "{log_path}"
-
-        if [ "{auto_shutdown}" = "True" ] && [ "$idle_count" -ge "{idle_limit}" ]; then
-            echo "Auto-shutdown: no work remaining" >> "{log_path}"
-            exit 0
-        fi
-
-        sleep 5
-        ((iteration++))
-        continue
-    fi
-
-    # Pick first unassigned issue (prioritized by beads)
-    issue_id=$(echo "$unassigned_json" | jq -r '.[0].id // empty' 2>/dev/null)
-
-    if [ -z "$issue_id" ]; then
-        echo "Failed to parse issue ID, retrying..." >> "{log_path}"
-        sleep 2
-        ((iteration++))
-        continue
-    fi
-
-    # Atomically claim the issue
-    echo "Attempting to claim issue $issue_id..." >> "{log_path}"
-    bd update "$issue_id" --status in_progress --assignee "{worker_id}" >> "{log_path}" 2>&1
-
-    # Verify claim succeeded (handle both dict and list responses)
-    claimed_by=$(bd show "$issue_id" --json 2>/dev/null | \\
-        jq -r 'if type == "array" then .[0].assignee else .assignee end' 2>/dev/null)
-
-    if [ "$claimed_by" != "{worker_id}" ]; then
-        echo "Failed to claim $issue_id (claimed by $claimed_by), retrying..." >> "{log_path}"
-        sleep $((RANDOM % 3))  # Random backoff 0-2 seconds
-        ((iteration++))
-        continue
-    fi
-
-    echo "Successfully claimed $issue_id" >> "{log_path}"
-    idle_count=0
-
-    # Launch Claude with the pre-assigned issue
-    cat << PROMPT_EOF | claude --dangerously-skip-permissions \\
-        --model {model}{verbose_flags} >> "{log_path}" 2>&1
-{get_worker_prompt(worker_id)}
-
-**ASSIGNED ISSUE:** $issue_id
-You have already been assigned issue $issue_id.
-Run \\`bd show $issue_id\\` to see details and implement it.
-Skip the claiming step - proceed directly to implementation.
-PROMPT_EOF
-
-    ((iteration++))
-    sleep 2
-done
-"""
-        script_path.write_text(script_content)
-        script_path.chmod(0o755)
-        worker_scripts.append(script_path)
-
-    # Start workers
-    for i, script in enumerate(worker_scripts, 1):
-        log_path = log_dir / f"ralph-{i}.log"
-        process = subprocess.Popen(  # noqa: S603
-            ["/bin/bash", str(script)],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            cwd=cwd,
+        futures.append(
+            executor.submit(
+                _run_swarm_worker,
+                worker_id,
+                model,
+                verbose,
+                auto_shutdown,
+                idle_limit,
+                work_dir,
+                log_dir / f"{worker_id}.log",
+            )
         )
-        processes.append(process)
-        console.print(f"[green]  Started ralph-{i} (PID: {process.pid})[/green]")
+        console.print(f"[green]  Started {worker_id}[/green]")
         time.sleep(1)  # Stagger launches
 
+    pgids: list[int] = []
+    with contextlib.suppress(queue.Empty):
+        for _ in range(workers):
+            pgids.append(worker_pids.get(timeout=WORKER_START_TIMEOUT))
+
     console.print()
     console.print("[bold]Workers running![/bold]")
-    console.print(f"PIDs: {[p.pid for p in processes]}")
+    console.print(f"PIDs: {pgids}")
     console.print()
     console.print("View logs:")
     for i in range(1, workers + 1):
@@ -582,9 +620,8 @@ done
     # Wait for workers
     def shutdown(sig, frame):
         console.print("\n[yellow]Stopping all workers...[/yellow]")
-        for p in processes:
-            with contextlib.suppress(ProcessLookupError):
-                p.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+        stop_workers(pgids)
         sys.exit(0)
 
     signal.signal(signal.SIGINT, shutdown)
@@ -599,11 +636,25 @@ done
         ) as progress:
             task = progress.add_task("Workers running...", total=None)
 
-            while any(p.poll() is None for p in processes):
-                alive = sum(1 for p in processes if p.poll() is None)
-                progress.update(task, description=f"Workers running: {alive}/{workers}")
-                time.sleep(2)
-
+            # Block until a worker exits, waking periodically to check the queue.
+            # The spinner animates on its own thread, so pause it while nothing
+            # is queued. Workers may still be busy on issues they've claimed.
+            running = set(futures)
+            while running:
+                if get_work_status(cwd)["unassigned"] == 0:
+                    progress.update(
+                        task, description=f"No queued work - workers: {len(running)}/{workers}"
+                    )
+                    progress.stop()
+                else:
+                    progress.update(task, description=f"Workers running: {len(running)}/{workers}")
+                    progress.start()
+                _, running = wait(running, timeout=MONITOR_INTERVAL, return_when=FIRST_COMPLETED)
+
+        executor.shutdown()
+        for i, future in enumerate(futures, 1):
+            if future.exception():
+                console.print(f"[red]ralph-{i} failed: {future.exception()}[/red]")
         console.print("[green]All workers finished[/green]")
 
     except KeyboardInterrupt:
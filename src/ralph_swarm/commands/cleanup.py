@@ -1,43 +1,37 @@
 """Cleanup command - Clean up orphaned work from crashed workers."""
 
-import json
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
-from rich.console import Console
 from rich.prompt import Confirm
 from rich.table import Table
 
-console = Console()
+from ralph_swarm.beads import get_client
+from ralph_swarm.commands import get_project_dir, get_running_workers
+from ralph_swarm.ui import console
 
 
 def get_in_progress_issues(cwd: Path) -> list[dict]:
     """Get all in-progress issues."""
-    result = subprocess.run(  # noqa: S603, S607
-        ["bd", "list", "--status", "in_progress", "--json"],
-        capture_output=True,
-        text=True,
-        cwd=cwd,
-    )
-    if result.returncode != 0:
-        return []
-
-    try:
-        return json.loads(result.stdout)
-    except json.JSONDecodeError:
-        return []
-
-
-def check_worker_running(worker_id: str) -> bool:
-    """Check if a worker process is running."""
-    result = subprocess.run(  # noqa: S603, S607
-        ["pgrep", "-f", f"BD_ACTOR={worker_id}"],
-        capture_output=True,
-        text=True,
-    )
-    return result.returncode == 0
+    return get_client(cwd).list(status="in_progress") or []
+
+
+def reset_issues(cwd: Path, issue_ids: list[str]) -> None:
+    """Reset issues to open and clear their assignee.
+
+    All issues are updated with one bd call. If bd rejects the batch, each
+    issue is updated separately, with the calls run in parallel.
+    """
+    client = get_client(cwd)
+    reset_args = ("--status", "open", "--assignee", "")
+    if client.update(*issue_ids, *reset_args):
+        return
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda issue_id: client.update(issue_id, *reset_args), issue_ids))
 
 
 @click.command("cleanup")
@@ -49,7 +43,7 @@ def cleanup_cmd(force: bool, discard_changes: bool) -> None:
     Finds issues that are 'in_progress' but have no active worker
     and resets them to 'open' status.
     """
-    cwd = Path.cwd()
+    cwd = get_project_dir()
 
     # Check for beads
     if not (cwd / ".beads").exists():
@@ -69,9 +63,15 @@ def cleanup_cmd(force: bool, discard_changes: bool) -> None:
     orphaned = []
     active = []
 
+    running_workers = get_running_workers()
+    if running_workers is None:
+        console.print("[red]Can't read process environments to find running workers.[/red]")
+        console.print("Not resetting anything; live workers' issues would look orphaned.")
+        sys.exit(1)
+
     for issue in in_progress:
         assignee = issue.get("assignee", "")
-        if assignee and check_worker_running(assignee):
+        if assignee and assignee in running_workers:
             active.append(issue)
         else:
             orphaned.append(issue)
@@ -121,16 +121,10 @@ def cleanup_cmd(force: bool, discard_changes: bool) -> None:
 
     # Reset orphaned issues
     console.print("\n[bold]Resetting orphaned issues...[/bold]")
-    for issue in orphaned:
-        issue_id = issue.get("id", "")
+    issue_ids = [issue.get("id", "") for issue in orphaned]
+    for issue_id in issue_ids:
         console.print(f"  Resetting {issue_id[:8]}...")
-
-        # Update status to open and clear assignee
-        subprocess.run(  # noqa: S603, S607
-            ["bd", "update", issue_id, "--status", "open", "--assignee", ""],
-            capture_output=True,
-            cwd=cwd,
-        )
+    reset_issues(cwd, issue_ids)
 
     console.print(f"\n[green]Reset {len(orphaned)} issue(s)[/green]")
 
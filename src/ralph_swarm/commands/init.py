@@ -1,32 +1,26 @@
 """Init command - Interactive project setup."""
 
+import functools
+import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
 import click
-from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
 
+from ralph_swarm.commands import get_project_dir
 from ralph_swarm.prompts import load_prompt_with_vars
-
-console = Console()
+from ralph_swarm.ui import console
 
 
+@functools.cache
 def check_dependencies() -> list[str]:
-    """Check for required dependencies."""
-    missing = []
-    for cmd in ["claude", "bd", "git"]:
-        result = subprocess.run(
-            ["which", cmd],
-            capture_output=True,
-            text=True,  # noqa: S603, S607
-        )
-        if result.returncode != 0:
-            missing.append(cmd)
-    return missing
+    """Check for required dependencies on PATH."""
+    return [cmd for cmd in ("claude", "bd", "git") if shutil.which(cmd) is None]
 
 
 def run_command(cmd: list[str], cwd: Path | None = None) -> subprocess.CompletedProcess[str]:
@@ -37,7 +31,7 @@ def run_command(cmd: list[str], cwd: Path | None = None) -> subprocess.Completed
 def is_initialized(path: Path) -> bool:
     """Check if a project is already initialized."""
     markers = [".beads", "CLAUDE.md"]
-    return any((path / marker).exists() for marker in markers)
+    return any(os.path.exists(os.path.join(path, marker)) for marker in markers)
 
 
 @click.command("init")
@@ -50,7 +44,7 @@ def init_cmd() -> None:
     - Initialize git and beads
     - Generate a CLAUDE.md scaffold
     """
-    project_path = Path.cwd()
+    project_path = get_project_dir()
     project_name = project_path.name
 
     console.print(
@@ -1,44 +1,29 @@
 """Plan command - Planning mode for creating epics and stories."""
 
+import contextlib
 import subprocess
 import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 import click
-from rich.console import Console
 from rich.live import Live
 from rich.panel import Panel
 from rich.spinner import Spinner
 from rich.table import Table
 
+from ralph_swarm.beads import get_beads_summary
+from ralph_swarm.commands import get_project_dir
 from ralph_swarm.prompts import load_prompt
-
-console = Console()
-
-
-def get_beads_summary(cwd: Path) -> dict[str, int]:
-    """Get a summary of current beads issues."""
-    result = subprocess.run(  # noqa: S603, S607
-        ["bd", "list", "--json"],
-        capture_output=True,
-        text=True,
-        cwd=cwd,
-    )
-    if result.returncode != 0:
-        return {}
-
-    import json
-
-    try:
-        issues = json.loads(result.stdout)
-        summary = {"total": len(issues), "open": 0, "in_progress": 0, "closed": 0}
-        for issue in issues:
-            status = issue.get("status", "open")
-            if status in summary:
-                summary[status] += 1
-        return summary
-    except (json.JSONDecodeError, KeyError):
-        return {}
+from ralph_swarm.ui import console
+
+_DONE_PANEL = Panel.fit(
+    "[green]Planning complete![/green]\n\n"
+    "Next steps:\n"
+    "  1. Review created issues: [bold]bd list[/bold]\n"
+    "  2. Check dependency graph: [bold]bd ready[/bold]\n"
+    "  3. Start building: [bold]ralph build[/bold]",
+    title="Done",
+)
 
 
 @click.command("plan")
@@ -56,7 +41,7 @@ def plan_cmd(model: str, verbose: bool, dry_run: bool, iterations: int) -> None:
     This phase analyzes your specs and creates a structured backlog
     of epics and stories in beads.
     """
-    cwd = Path.cwd()
+    cwd = get_project_dir()
 
     # Check for required files
     if not (cwd / "CLAUDE.md").exists():
@@ -67,12 +52,22 @@ def plan_cmd(model: str, verbose: bool, dry_run: bool, iterations: int) -> None:
         console.print("[red]Beads not initialized. Run 'ralph init' first.[/red]")
         sys.exit(1)
 
-    console.print(
-        Panel.fit("[bold blue]Ralph Swarm[/bold blue] - Planning Mode", subtitle=f"Model: {model}")
-    )
+    # Query bd and read the prompt in the background while the header prints
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        summary_future = pool.submit(get_beads_summary, cwd)
+        prompt_future = pool.submit(load_prompt, "system/plan")
+
+        console.print(
+            Panel.fit(
+                "[bold blue]Ralph Swarm[/bold blue] - Planning Mode", subtitle=f"Model: {model}"
+            )
+        )
+
+        summary = summary_future.result()
+        plan_prompt = prompt_future.result()
 
     # Show current state
-    summary = get_beads_summary(cwd)
+    pre_total = summary.get("total", 0)
     if summary:
         table = Table(title="Current Beads State", show_header=False)
         table.add_column("Metric", style="bold")
@@ -84,50 +79,59 @@ def plan_cmd(model: str, verbose: bool, dry_run: bool, iterations: int) -> None:
         console.print(table)
         console.print()
 
-    # Load prompt
-    plan_prompt = load_prompt("system/plan")
-
     if dry_run:
         console.print("[bold]Prompt that would be sent:[/bold]")
         console.print(Panel(plan_prompt, title="Planning Prompt"))
         return
 
+    # The command is the same for every iteration; the prompt goes on stdin
+    cmd = [
+        "claude",
+        "--dangerously-skip-permissions",
+        "--model", model,
+    ]
+
+    if verbose:
+        cmd.extend(["--output-format", "stream-json", "--verbose"])
+
     for i in range(iterations):
         if iterations > 1:
             console.print(f"\n[bold]Planning iteration {i + 1}/{iterations}[/bold]")
 
         console.print("[dim]Running Claude in planning mode...[/dim]")
 
-        cmd = [
-            "claude",
-            "--dangerously-skip-permissions",
-            "--model", model,
-        ]
-
-        if verbose:
-            cmd.extend(["--output-format", "stream-json", "--verbose"])
-
         try:
             if verbose:
-                # Stream output in real-time
+                # Stream output in real-time. The stream is forwarded as raw
+                # bytes; it has no Rich markup, so console.print adds nothing.
                 process = subprocess.Popen(  # noqa: S603
                     cmd,
                     stdin=subprocess.PIPE,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
-                    text=True,
+                    bufsize=0,
                     cwd=cwd,
                 )
                 if process.stdin:
-                    process.stdin.write(plan_prompt)
+                    process.stdin.write(plan_prompt.encode())
                     process.stdin.close()
                 if process.stdout:
-                    for line in process.stdout:
-                        console.print(line, end="")
+                    sys.stdout.flush()
+                    out = sys.stdout.buffer
+                    # Unbuffered pipe: read() returns whatever is available
+                    while chunk := process.stdout.read(65536):
+                        out.write(chunk)
+                        out.flush()
                 process.wait()
             else:
-                # Show spinner while running
-                with Live(Spinner("dots", text="Planning..."), console=console):
+                # Show spinner while running. Skip it when output isn't a
+                # terminal; its refresh thread would have nothing to draw.
+                spinner = (
+                    Live(Spinner("dots", text="Planning..."), console=console)
+                    if console.is_terminal
+                    else contextlib.nullcontext()
+                )
+                with spinner:
                     result = subprocess.run(  # noqa: S603
                         cmd,
                         input=plan_prompt,
@@ -150,20 +154,13 @@ def plan_cmd(model: str, verbose: bool, dry_run: bool, iterations: int) -> None:
     console.print()
     new_summary = get_beads_summary(cwd)
     if new_summary:
-        created = new_summary.get("total", 0) - summary.get("total", 0)
+        created = new_summary["total"] - pre_total
         if created > 0:
             console.print(f"[green]Created {created} new issue(s)[/green]")
 
-        console.print("\n[bold]Ready issues:[/bold]")
-        subprocess.run(["bd", "ready"], cwd=cwd)  # noqa: S603, S607
-
-    console.print(
-        Panel.fit(
-            "[green]Planning complete![/green]\n\n"
-            "Next steps:\n"
-            "  1. Review created issues: [bold]bd list[/bold]\n"
-            "  2. Check dependency graph: [bold]bd ready[/bold]\n"
-            "  3. Start building: [bold]ralph build[/bold]",
-            title="Done",
-        )
-    )
+        # Nothing can be ready in an empty backlog; skip the extra bd call
+        if new_summary["total"]:
+            console.print("\n[bold]Ready issues:[/bold]")
+            subprocess.run(["bd", "ready"], cwd=cwd)  # noqa: S603, S607
+
+    console.print(_DONE_PANEL)
@@ -1,45 +1,74 @@
 """Research command - Interactive research session for technologies and approaches."""
 
-import re
+import os
+import string
 import subprocess
 import sys
 from pathlib import Path
 
 import click
-from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
 
+from ralph_swarm.commands import get_project_dir
 from ralph_swarm.prompts import load_prompt
+from ralph_swarm.ui import console
+
+_DONE_PANEL = Panel.fit(
+    "[green]Research session complete![/green]\n\n"
+    "Next steps:\n"
+    "  1. Review research: [bold]ls docs/research/[/bold]\n"
+    "  2. Define specs: [bold]ralph specify[/bold]\n"
+    "  3. Run planning: [bold]ralph plan[/bold]",
+    title="Done",
+)
+
+# research directory -> (mtime_ns, document names) from the last scan
+_research_status_cache: dict[Path, tuple[int, tuple[str, ...]]] = {}
 
-console = Console()
+_SLUG_CHARS = frozenset(string.ascii_lowercase + string.digits)
 
 
 def slugify(text: str) -> str:
     """Convert text to a URL-friendly slug."""
-    # Convert to lowercase
-    text = text.lower()
-    # Replace spaces and underscores with hyphens
-    text = re.sub(r"[\s_]+", "-", text)
-    # Remove any characters that aren't alphanumeric or hyphens
-    text = re.sub(r"[^a-z0-9-]", "", text)
-    # Remove multiple consecutive hyphens
-    text = re.sub(r"-+", "-", text)
-    # Strip leading/trailing hyphens
-    text = text.strip("-")
-    return text
+    out: list[str] = []
+    # Start as if after a hyphen so leading separators are dropped
+    after_hyphen = True
+    for ch in text.lower():
+        if ch in _SLUG_CHARS:
+            out.append(ch)
+            after_hyphen = False
+        elif not after_hyphen and (ch in "-_" or ch.isspace()):
+            # Spaces, underscores and hyphens collapse to a single hyphen
+            out.append("-")
+            after_hyphen = True
+        # Anything else is dropped
+    if after_hyphen and out:
+        out.pop()
+    return "".join(out)
 
 
 def get_research_status(cwd: Path) -> dict:
     """Get current research status."""
     research_dir = cwd / "docs" / "research"
-    if not research_dir.exists():
+    try:
+        mtime = research_dir.stat().st_mtime_ns
+    except FileNotFoundError:
         return {"exists": False, "files": []}
 
-    research_files = list(research_dir.glob("*.md"))
+    # Adding, removing or renaming a document changes the directory's mtime
+    # The names are cached as a tuple and each caller gets its own list
+    cached = _research_status_cache.get(research_dir)
+    if cached and cached[0] == mtime:
+        files = cached[1]
+    else:
+        with os.scandir(research_dir) as entries:
+            files = tuple(e.name for e in entries if e.name.endswith(".md") and e.is_file())
+        _research_status_cache[research_dir] = (mtime, files)
+
     return {
         "exists": True,
-        "files": [f.name for f in research_files],
+        "files": list(files),
     }
 
 
@@ -89,7 +118,7 @@ def research_cmd(
         ralph research          # Interactive research session
         ralph research --dry-run  # Show prompt without executing
     """
-    cwd = Path.cwd()
+    cwd = get_project_dir()
 
     # Check for required files
     if not (cwd / "CLAUDE.md").exists():
@@ -187,7 +216,9 @@ def research_cmd(
     console.print()
     new_status = get_research_status(cwd)
 
-    new_files = set(new_status["files"]) - set(status["files"])
+    # Keep directory order for display
+    old_files = frozenset(status["files"])
+    new_files = [f for f in new_status["files"] if f not in old_files]
     if new_files:
         console.print("[bold]New research created:[/bold]")
         for f in new_files:
@@ -197,13 +228,4 @@ def research_cmd(
         for f in new_status["files"]:
             console.print(f"  docs/research/{f}")
 
-    console.print(
-        Panel.fit(
-            "[green]Research session complete![/green]\n\n"
-            "Next steps:\n"
-            "  1. Review research: [bold]ls docs/research/[/bold]\n"
-            "  2. Define specs: [bold]ralph specify[/bold]\n"
-            "  3. Run planning: [bold]ralph plan[/bold]",
-            title="Done",
-        )
-    )
+    console.print(_DONE_PANEL)
@@ -1,33 +1,56 @@
 """Specify command - Build project specifications."""
 
+import os
 import subprocess
 import sys
 from pathlib import Path
 
 import click
-from rich.console import Console
+from rich.console import Group, RenderableType
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
 
+from ralph_swarm.commands import get_project_dir
 from ralph_swarm.prompts import load_prompt
+from ralph_swarm.ui import console
+
+_DONE_PANEL = Panel.fit(
+    "[green]Specification session complete![/green]\n\n"
+    "Next steps:\n"
+    "  1. Review specs: [bold]ls specs/[/bold]\n"
+    "  2. Run planning: [bold]ralph plan[/bold]\n"
+    "  3. Start building: [bold]ralph build[/bold]",
+    title="Done",
+)
 
-console = Console()
+# specs directory -> (mtime_ns, spec names, v0 spec names) from the last scan
+_spec_status_cache: dict[Path, tuple[int, tuple[str, ...], tuple[str, ...]]] = {}
 
 
 def get_spec_status(cwd: Path) -> dict:
     """Get current specification status."""
     specs_dir = cwd / "specs"
-    if not specs_dir.exists():
+    try:
+        mtime = specs_dir.stat().st_mtime_ns
+    except FileNotFoundError:
         return {"exists": False, "files": [], "has_v0": False}
 
-    spec_files = list(specs_dir.glob("*.md"))
-    v0_files = [f for f in spec_files if f.name.startswith("v0")]
+    # Adding, removing or renaming a spec changes the directory's mtime
+    # The names are cached as tuples and each caller gets its own lists
+    cached = _spec_status_cache.get(specs_dir)
+    if cached and cached[0] == mtime:
+        _, files, v0_files = cached
+    else:
+        with os.scandir(specs_dir) as entries:
+            files = tuple(e.name for e in entries if e.name.endswith(".md") and e.is_file())
+        v0_files = tuple(name for name in files if name.startswith("v0"))
+        _spec_status_cache[specs_dir] = (mtime, files, v0_files)
 
     return {
         "exists": True,
-        "files": [f.name for f in spec_files],
+        "files": list(files),
         "has_v0": len(v0_files) > 0,
-        "v0_files": [f.name for f in v0_files],
+        "v0_files": list(v0_files),
     }
 
 
@@ -96,7 +119,7 @@ def specify_cmd(
         ralph specify          # Interactive mode selection
         ralph specify --full   # Full specification mode
     """
-    cwd = Path.cwd()
+    cwd = get_project_dir()
 
     # Check for required files
     if not (cwd / "CLAUDE.md").exists():
@@ -114,16 +137,16 @@ def specify_cmd(
     elif status["has_v0"]:
         # V0 exists, ask what they want to do
         console.print(
-            Panel.fit(
-                "[bold blue]Ralph Swarm[/bold blue] - Specify Mode", subtitle=f"Model: {model}"
+            Group(
+                Panel.fit(
+                    "[bold blue]Ralph Swarm[/bold blue] - Specify Mode", subtitle=f"Model: {model}"
+                ),
+                "[bold]Existing V0 specs found:[/bold]",
+                *(f"  [green]●[/green] specs/{f}" for f in status.get("v0_files", [])),
+                "",
             )
         )
 
-        console.print("[bold]Existing V0 specs found:[/bold]")
-        for f in status.get("v0_files", []):
-            console.print(f"  [green]●[/green] specs/{f}")
-        console.print()
-
         if Confirm.ask("Add a new feature? (No to refine V0)"):
             feature = Prompt.ask("Feature name")
             mode = "incremental"
@@ -134,17 +157,21 @@ def specify_cmd(
     else:
         # No V0 exists, ask which mode they want
         console.print(
-            Panel.fit(
-                "[bold blue]Ralph Swarm[/bold blue] - Specify Mode", subtitle=f"Model: {model}"
+            Group(
+                Panel.fit(
+                    "[bold blue]Ralph Swarm[/bold blue] - Specify Mode", subtitle=f"Model: {model}"
+                ),
+                "[bold]How would you like to specify this project?[/bold]",
+                "",
+                "  [bold]1.[/bold] Iterative [dim](recommended)[/dim]",
+                "     Start with minimal V0, add features incrementally",
+                "",
+                "  [bold]2.[/bold] Full specification",
+                "     Comprehensive Q&A to fully specify upfront",
+                "",
             )
         )
 
-        console.print("[bold]How would you like to specify this project?[/bold]\n")
-        console.print("  [bold]1.[/bold] Iterative [dim](recommended)[/dim]")
-        console.print("     Start with minimal V0, add features incrementally\n")
-        console.print("  [bold]2.[/bold] Full specification")
-        console.print("     Comprehensive Q&A to fully specify upfront\n")
-
         choice = Prompt.ask("Choose", choices=["1", "2"], default="1")
 
         if choice == "2":
@@ -154,21 +181,21 @@ def specify_cmd(
             mode = "initial"
             mode_label = "Initial V0"
 
-    console.print(
+    # Header and existing specs go out in a single render
+    header: list[RenderableType] = [
         Panel.fit(
             "[bold blue]Ralph Swarm[/bold blue] - Specify Mode",
             subtitle=f"{mode_label} | Model: {model}",
         )
-    )
-
-    # Show existing specs
+    ]
     if status["exists"] and status["files"]:
-        console.print("[bold]Existing specs:[/bold]")
+        header.append("[bold]Existing specs:[/bold]")
         for f in status["files"]:
             is_v0 = f.startswith("v0")
             marker = "[green]●[/green]" if is_v0 else "[dim]○[/dim]"
-            console.print(f"  {marker} specs/{f}")
-        console.print()
+            header.append(f"  {marker} specs/{f}")
+        header.append("")
+    console.print(Group(*header))
 
     # Ensure specs directory exists
     specs_dir = cwd / "specs"
@@ -255,7 +282,9 @@ def specify_cmd(
     console.print()
     new_status = get_spec_status(cwd)
 
-    new_files = set(new_status["files"]) - set(status["files"])
+    # Keep directory order for display
+    old_files = frozenset(status["files"])
+    new_files = [f for f in new_status["files"] if f not in old_files]
     if new_files:
         console.print("[bold]New specs created:[/bold]")
         for f in new_files:
@@ -265,13 +294,4 @@ def specify_cmd(
         for f in new_status["files"]:
             console.print(f"  specs/{f}")
 
-    console.print(
-        Panel.fit(
-            "[green]Specification session complete![/green]\n\n"
-            "Next steps:\n"
-            "  1. Review specs: [bold]ls specs/[/bold]\n"
-            "  2. Run planning: [bold]ralph plan[/bold]\n"
-            "  3. Start building: [bold]ralph build[/bold]",
-            title="Done",
-        )
-    )
+    console.print(_DONE_PANEL)
@@ -1,18 +1,81 @@
 """Status command - Show project and worker status."""
 
-import json
 import subprocess
 import sys
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
-from rich.console import Console
 from rich.markup import escape
 from rich.panel import Panel
 from rich.table import Table
 from rich.tree import Tree
 
-console = Console()
+from ralph_swarm.beads import parse_json
+from ralph_swarm.commands import get_project_dir, get_running_workers
+from ralph_swarm.ui import console
+
+_STATUS_COLORS = {"open": "yellow", "in_progress": "blue", "closed": "green"}
+_STATUS_ICONS = {"open": "○", "in_progress": "◐", "closed": "●"}
+
+# Support both string priorities and numeric (0=highest)
+_PRIORITY_COLORS = {
+    "critical": "red",
+    "high": "yellow",
+    "medium": "white",
+    "low": "dim",
+    "0": "red",
+    "1": "yellow",
+    "2": "white",
+    "3": "dim",
+}
+
+_BAR_WIDTH = 40
+
+# Number of ready issues listed before the rest are summarized
+_READY_QUEUE_LIMIT = 10
+
+# Column headers and options for each status table
+_ColumnSpecs = tuple[tuple[str, dict[str, str]], ...]
+
+_SUMMARY_COLUMNS: _ColumnSpecs = (
+    ("Status", {"style": "bold"}),
+    ("Count", {"justify": "right"}),
+    ("Percent", {"justify": "right"}),
+)
+_TYPE_COLUMNS: _ColumnSpecs = (
+    ("Type", {"style": "bold"}),
+    ("Count", {"justify": "right"}),
+)
+_READY_COLUMNS: _ColumnSpecs = (
+    ("ID", {"style": "dim"}),
+    ("Type", {}),
+    ("Priority", {}),
+    ("Title", {}),
+    ("Assignee", {}),
+)
+_PROGRESS_COLUMNS: _ColumnSpecs = (
+    ("ID", {"style": "dim"}),
+    ("Type", {}),
+    ("Title", {}),
+    ("Worker", {"style": "bold"}),
+)
+_VERBOSE_COLUMNS: _ColumnSpecs = (
+    ("ID", {"style": "dim"}),
+    ("Status", {}),
+    ("Type", {}),
+    ("Priority", {}),
+    ("Title", {}),
+)
+
+
+def _new_table(title: str, columns: _ColumnSpecs) -> Table:
+    """A fresh table with the given columns."""
+    table = Table(title=title, show_header=True)
+    for header, options in columns:
+        table.add_column(header, **options)
+    return table
 
 
 def extract_bead_id(full_id: str) -> str:
@@ -32,20 +95,37 @@ def extract_bead_id(full_id: str) -> str:
     return full_id
 
 
+def _escape(text: str) -> str:
+    """Escape Rich markup, skipping the regex when there is nothing to escape."""
+    if "[" not in text and not text.endswith("\\"):
+        return text
+    return escape(text)
+
+
+def _verbose_row(issue: dict) -> tuple[str, str, str, str, str]:
+    """Pre-formatted cells for one row of the verbose issue table."""
+    issue_status = str(issue.get("status", "open"))
+    status_color = _STATUS_COLORS.get(issue_status, "")
+    return (
+        extract_bead_id(issue.get("id", "")),
+        f"[{status_color}]{_escape(issue_status)}[/{status_color}]",
+        _escape(str(issue.get("type", "task"))),
+        _escape(str(issue.get("priority", "medium"))),
+        _escape(str(issue.get("title", ""))[:50]),
+    )
+
+
 def get_issues(cwd: Path, status_filter: str | None = None) -> list[dict]:
     """Get issues from beads."""
     cmd = ["bd", "list", "--json", "--all", "--limit", "0"]
     if status_filter:
         cmd.extend(["--status", status_filter])
 
-    result = subprocess.run(cmd, capture_output=True, text=True, cwd=cwd)  # noqa: S603
+    result = subprocess.run(cmd, capture_output=True, cwd=cwd)  # noqa: S603
     if result.returncode != 0:
         return []
 
-    try:
-        return json.loads(result.stdout)
-    except json.JSONDecodeError:
-        return []
+    return parse_json(result.stdout) or []
 
 
 def get_ready_issues(cwd: Path) -> list[dict]:
@@ -53,35 +133,12 @@ def get_ready_issues(cwd: Path) -> list[dict]:
     result = subprocess.run(  # noqa: S603, S607
         ["bd", "ready", "--json"],
         capture_output=True,
-        text=True,
         cwd=cwd,
     )
     if result.returncode != 0:
         return []
 
-    try:
-        return json.loads(result.stdout)
-    except json.JSONDecodeError:
-        return []
-
-
-def check_running_workers(cwd: Path) -> list[dict]:
-    """Check for running ralph workers."""
-    workers = []
-
-    # Check for ralph worker processes
-    result = subprocess.run(  # noqa: S603, S607
-        ["pgrep", "-f", "ralph-worker"],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode == 0:
-        pids = result.stdout.strip().split("\n")
-        for pid in pids:
-            if pid:
-                workers.append({"pid": pid, "type": "worker"})
-
-    return workers
+    return parse_json(result.stdout) or []
 
 
 @click.command("status")
@@ -96,7 +153,7 @@ def status_cmd(verbose: bool, tree: bool) -> None:
     - Running workers
     - Recent activity
     """
-    cwd = Path.cwd()
+    cwd = get_project_dir()
 
     # Check for beads
     if not (cwd / ".beads").exists():
@@ -106,31 +163,35 @@ def status_cmd(verbose: bool, tree: bool) -> None:
 
     console.print(Panel.fit("[bold blue]Ralph Swarm[/bold blue] - Status", subtitle=str(cwd.name)))
 
-    # Get all issues
-    all_issues = get_issues(cwd)
-    ready_issues = get_ready_issues(cwd)
+    # The three queries are independent subprocesses; run them side by side
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        issues_future = pool.submit(get_issues, cwd)
+        ready_future = pool.submit(get_ready_issues, cwd)
+        workers_future = pool.submit(get_running_workers)
 
-    # Count by status
-    status_counts = {"open": 0, "in_progress": 0, "closed": 0}
-    type_counts: dict[str, int] = {}
+    all_issues = issues_future.result()
+    ready_issues = ready_future.result()
+    workers = workers_future.result()
 
+    # Count by status and type and pick out in-progress issues in one pass,
+    # always listing the three core statuses first
+    status_counts = {"open": 0, "in_progress": 0, "closed": 0}
+    type_counts: Counter[str] = Counter()
+    in_progress_issues = []
     for issue in all_issues:
-        status = issue.get("status", "open")
-        issue_type = issue.get("type", "task")
-
-        status_counts[status] = status_counts.get(status, 0) + 1
-        type_counts[issue_type] = type_counts.get(issue_type, 0) + 1
+        issue_status = issue.get("status", "open")
+        status_counts[issue_status] = status_counts.get(issue_status, 0) + 1
+        type_counts[issue.get("type", "task")] += 1
+        if issue_status == "in_progress":
+            in_progress_issues.append(issue)
 
     # Summary table
-    summary_table = Table(title="Issue Summary", show_header=True)
-    summary_table.add_column("Status", style="bold")
-    summary_table.add_column("Count", justify="right")
-    summary_table.add_column("Percent", justify="right")
+    summary_table = _new_table("Issue Summary", _SUMMARY_COLUMNS)
 
     total = len(all_issues)
     for status, count in status_counts.items():
         pct = f"{(count / total * 100):.1f}%" if total > 0 else "0%"
-        color = {"open": "yellow", "in_progress": "blue", "closed": "green"}.get(status, "")
+        color = _STATUS_COLORS.get(status, "")
         summary_table.add_row(f"[{color}]{status}[/{color}]", str(count), pct)
 
     summary_table.add_row("[bold]Total[/bold]", f"[bold]{total}[/bold]", "")
@@ -139,86 +200,64 @@ def status_cmd(verbose: bool, tree: bool) -> None:
 
     # Type breakdown
     if type_counts:
-        type_table = Table(title="By Type", show_header=True)
-        type_table.add_column("Type", style="bold")
-        type_table.add_column("Count", justify="right")
+        type_table = _new_table("By Type", _TYPE_COLUMNS)
 
-        for issue_type, count in sorted(type_counts.items(), key=lambda x: -x[1]):
-            type_table.add_row(escape(str(issue_type)), str(count))
+        for issue_type, count in type_counts.most_common():
+            type_table.add_row(_escape(str(issue_type)), str(count))
 
         console.print(type_table)
         console.print()
 
     # Ready queue
     if ready_issues:
-        ready_table = Table(title="Ready Queue", show_header=True)
-        ready_table.add_column("ID", style="dim")
-        ready_table.add_column("Type")
-        ready_table.add_column("Priority")
-        ready_table.add_column("Title")
-        ready_table.add_column("Assignee")
-
-        for issue in ready_issues[:10]:  # Show top 10
+        ready_table = _new_table("Ready Queue", _READY_COLUMNS)
+
+        for issue in ready_issues[:_READY_QUEUE_LIMIT]:
             priority = str(issue.get("priority", "medium"))
-            # Support both string priorities and numeric (0=highest)
-            priority_color = {
-                "critical": "red",
-                "high": "yellow",
-                "medium": "white",
-                "low": "dim",
-                "0": "red",
-                "1": "yellow",
-                "2": "white",
-                "3": "dim",
-            }.get(priority)
+            priority_color = _PRIORITY_COLORS.get(priority)
 
             # Only apply color if we have one, otherwise just escape the text
             if priority_color:
-                priority_display = f"[{priority_color}]{escape(priority)}[/{priority_color}]"
+                priority_display = f"[{priority_color}]{_escape(priority)}[/{priority_color}]"
             else:
-                priority_display = escape(priority)
+                priority_display = _escape(priority)
 
             ready_table.add_row(
                 extract_bead_id(issue.get("id", "")),
-                escape(str(issue.get("type", "task"))),
+                _escape(str(issue.get("type", "task"))),
                 priority_display,
-                escape(str(issue.get("title", ""))[:40]),
-                escape(str(issue.get("assignee") or "-")),
+                _escape(str(issue.get("title", ""))[:40]),
+                _escape(str(issue.get("assignee") or "-")),
             )
 
         console.print(ready_table)
 
-        if len(ready_issues) > 10:
-            console.print(f"[dim]  ... and {len(ready_issues) - 10} more[/dim]")
+        hidden = len(ready_issues) - _READY_QUEUE_LIMIT
+        if hidden > 0:
+            console.print(f"[dim]  ... and {hidden} more[/dim]")
 
         console.print()
 
     # In progress issues
-    in_progress_issues = [i for i in all_issues if i.get("status") == "in_progress"]
     if in_progress_issues:
-        progress_table = Table(title="In Progress", show_header=True)
-        progress_table.add_column("ID", style="dim")
-        progress_table.add_column("Type")
-        progress_table.add_column("Title")
-        progress_table.add_column("Worker", style="bold")
+        progress_table = _new_table("In Progress", _PROGRESS_COLUMNS)
 
         for issue in in_progress_issues:
             progress_table.add_row(
                 extract_bead_id(issue.get("id", "")),
-                escape(str(issue.get("type", "task"))),
-                escape(str(issue.get("title", ""))[:50]),
-                escape(str(issue.get("assignee") or "-")),
+                _escape(str(issue.get("type", "task"))),
+                _escape(str(issue.get("title", ""))[:50]),
+                _escape(str(issue.get("assignee") or "-")),
             )
 
         console.print(progress_table)
         console.print()
 
-    # Check for running workers
-    workers = check_running_workers(cwd)
+    # Running workers
     if workers:
         console.print(f"[green]Running workers: {len(workers)}[/green]")
-        for w in workers:
-            console.print(f"  PID: {w['pid']}")
+        for worker_id in sorted(workers):
+            console.print(f"  {_escape(worker_id)}")
         console.print()
 
     # Show tree if requested
@@ -227,28 +266,10 @@ def status_cmd(verbose: bool, tree: bool) -> None:
 
     # Verbose mode - show all issues
     if verbose and all_issues:
-        verbose_table = Table(title="All Issues", show_header=True)
-        verbose_table.add_column("ID", style="dim")
-        verbose_table.add_column("Status")
-        verbose_table.add_column("Type")
-        verbose_table.add_column("Priority")
-        verbose_table.add_column("Title")
-
-        for issue in all_issues:
-            issue_status = str(issue.get("status", "open"))
-            status_color = {
-                "open": "yellow",
-                "in_progress": "blue",
-                "closed": "green",
-            }.get(issue_status, "")
-
-            verbose_table.add_row(
-                extract_bead_id(issue.get("id", "")),
-                f"[{status_color}]{escape(issue_status)}[/{status_color}]",
-                escape(str(issue.get("type", "task"))),
-                escape(str(issue.get("priority", "medium"))),
-                escape(str(issue.get("title", ""))[:50]),
-            )
+        verbose_table = _new_table("All Issues", _VERBOSE_COLUMNS)
+
+        for row in [_verbose_row(issue) for issue in all_issues]:
+            verbose_table.add_row(*row)
 
         console.print(verbose_table)
 
@@ -257,10 +278,9 @@ def status_cmd(verbose: bool, tree: bool) -> None:
         completed = status_counts.get("closed", 0)
         in_progress = status_counts.get("in_progress", 0)
 
-        bar_width = 40
-        completed_width = int(completed / total * bar_width)
-        in_progress_width = int(in_progress / total * bar_width)
-        remaining_width = bar_width - completed_width - in_progress_width
+        completed_width = completed * _BAR_WIDTH // total
+        in_progress_width = in_progress * _BAR_WIDTH // total
+        remaining_width = _BAR_WIDTH - completed_width - in_progress_width
 
         bar = (
             f"[green]{'█' * completed_width}[/green]"
@@ -273,44 +293,32 @@ def status_cmd(verbose: bool, tree: bool) -> None:
 
 def show_issue_tree(issues: list[dict]) -> None:
     """Show issues as a dependency tree."""
-    # Build parent-child relationships
-    children: dict[str, list[str]] = {}
-    parents: dict[str, str] = {}
+    # Index issues and their parent-child relationships in one pass
+    issue_map: dict[str, dict] = {}
+    children: defaultdict[str, list[str]] = defaultdict(list)
+    root_ids: list[str] = []
 
     for issue in issues:
         issue_id = issue.get("id", "")
+        issue_map[issue_id] = issue
         parent_id = issue.get("parent")
         if parent_id:
-            parents[issue_id] = parent_id
-            if parent_id not in children:
-                children[parent_id] = []
             children[parent_id].append(issue_id)
+        else:
+            root_ids.append(issue_id)
 
-    # Find root issues (no parent)
-    root_ids = [i.get("id", "") for i in issues if not i.get("parent")]
-
-    # Build tree
-    issue_map = {i.get("id", ""): i for i in issues}
+    # Build tree breadth-first; each node's children keep their original order
     tree = Tree("[bold]Issues[/bold]")
 
-    def add_children(parent_tree: Tree, parent_id: str) -> None:
-        for child_id in children.get(parent_id, []):
-            child = issue_map.get(child_id, {})
-            status = str(child.get("status", "open"))
-            status_icon = {"open": "○", "in_progress": "◐", "closed": "●"}.get(status, "○")
-            issue_type = escape(str(child.get("type", "task")))
-            title = escape(str(child.get("title", ""))[:40])
-            child_tree = parent_tree.add(f"{status_icon} \\[{issue_type}] {title}")
-            add_children(child_tree, child_id)
-
-    for root_id in root_ids:
-        issue = issue_map.get(root_id, {})
-        status = str(issue.get("status", "open"))
-        status_icon = {"open": "○", "in_progress": "◐", "closed": "●"}.get(status, "○")
-        issue_type = escape(str(issue.get("type", "task")))
-        title = escape(str(issue.get("title", ""))[:40])
-        root_tree = tree.add(f"{status_icon} \\[{issue_type}] {title}")
-        add_children(root_tree, root_id)
+    queue = deque((tree, root_id) for root_id in root_ids)
+    while queue:
+        parent_tree, issue_id = queue.popleft()
+        issue = issue_map.get(issue_id, {})
+        status_icon = _STATUS_ICONS.get(str(issue.get("status", "open")), "○")
+        issue_type = _escape(str(issue.get("type", "task")))
+        title = _escape(str(issue.get("title", ""))[:40])
+        node = parent_tree.add(f"{status_icon} \\[{issue_type}] {title}")
+        queue.extend((node, child_id) for child_id in children.get(issue_id, ()))
 
     console.print(tree)
     console.print()
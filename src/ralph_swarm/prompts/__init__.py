@@ -1,5 +1,7 @@
 """Prompt loading utilities."""
 
+import functools
+import re
 from pathlib import Path
 
 PROMPTS_DIR = Path(__file__).parent
@@ -7,9 +9,27 @@ AGENTS_DIR = PROMPTS_DIR / "agents"
 SYSTEM_DIR = PROMPTS_DIR / "system"
 
 
+@functools.cache
+def _load_template(name: str) -> str:
+    """Read a prompt template from disk, once per process."""
+    try:
+        return (PROMPTS_DIR / f"{name}.md").read_text()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Prompt not found: {name}") from None
+
+
+@functools.lru_cache(maxsize=32)
+def _placeholder_pattern(keys: frozenset[str]) -> re.Pattern[str]:
+    """Regex matching a {key} placeholder for any of the given keys."""
+    return re.compile(r"\{(" + "|".join(map(re.escape, sorted(keys))) + r")\}")
+
+
 def load_prompt(name: str) -> str:
     """Load a prompt file by name.
 
+    Templates are cached after the first read, so repeated loads in a
+    worker loop don't touch the disk again.
+
     Args:
         name: Prompt name (without .md extension), can include subdirectory
               e.g., "system/plan" or "agents/code-reviewer"
@@ -17,10 +37,7 @@ def load_prompt(name: str) -> str:
     Returns:
         Prompt content as string
     """
-    prompt_file = PROMPTS_DIR / f"{name}.md"
-    if not prompt_file.exists():
-        raise FileNotFoundError(f"Prompt not found: {name}")
-    return prompt_file.read_text()
+    return _load_template(name)
 
 
 def load_prompt_with_vars(name: str, **variables: str) -> str:
@@ -33,7 +50,8 @@ def load_prompt_with_vars(name: str, **variables: str) -> str:
     Returns:
         Prompt content with variables substituted
     """
-    content = load_prompt(name)
-    for key, value in variables.items():
-        content = content.replace(f"{{{key}}}", value)
-    return content
+    content = _load_template(name)
+    if not variables:
+        return content
+    pattern = _placeholder_pattern(frozenset(variables))
+    return pattern.sub(lambda m: variables[m.group(1)], content)
@@ -0,0 +1,5 @@
+"""Shared terminal output."""
+
+from rich.console import Console
+
+console = Console()
@@ -0,0 +1,89 @@
+"""Shared test fixtures."""
+
+import json
+import shutil
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from click.testing import CliRunner
+
+from ralph_swarm.ui import console
+
+# Results shared by every bd_mock install; callers only read them
+_EMPTY_RESULT = SimpleNamespace(returncode=0, stdout=b"", stderr=b"")
+
+
+@pytest.fixture(scope="session")
+def _project_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A minimal ralph-swarm project, built once per test session."""
+    template = tmp_path_factory.mktemp("project_template")
+    (template / ".beads").mkdir()
+    (template / "CLAUDE.md").write_text("# Project")
+    return template
+
+
+@pytest.fixture(scope="session")
+def empty_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """An empty directory shared by tests that don't write to it."""
+    return tmp_path_factory.mktemp("empty_project")
+
+
+@pytest.fixture(scope="session")
+def claude_only_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A directory with CLAUDE.md but no .beads, shared by tests that don't write to it."""
+    project = tmp_path_factory.mktemp("claude_only_project")
+    (project / "CLAUDE.md").write_text("# Project")
+    return project
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path, _project_template: Path) -> Path:
+    """A fresh copy of the minimal project in this test's tmp_path."""
+    shutil.copytree(_project_template, tmp_path, dirs_exist_ok=True)
+    return tmp_path
+
+
+@pytest.fixture
+def bd_mock(monkeypatch: pytest.MonkeyPatch):
+    """Install a fake subprocess.run that answers bd list/ready with canned issues.
+
+    Call it with the issues for bd list; bd ready returns the same issues
+    unless ready_issues is given. Each response is serialized once up front.
+    No workers are reported as running.
+    """
+
+    def install(issues: list[dict], ready_issues: list[dict] | None = None) -> None:
+        if ready_issues is None:
+            ready_issues = issues
+        # Real bd output is captured as bytes, so answer with bytes too
+        responses = {
+            ("bd", "list"): SimpleNamespace(
+                returncode=0, stdout=json.dumps(issues).encode(), stderr=b""
+            ),
+            ("bd", "ready"): SimpleNamespace(
+                returncode=0, stdout=json.dumps(ready_issues).encode(), stderr=b""
+            ),
+        }
+
+        def mock_run(cmd, *args, **kwargs):
+            return responses.get(tuple(cmd[:2]), _EMPTY_RESULT)
+
+        monkeypatch.setattr("subprocess.run", mock_run)
+        # Keep the host's real processes out of worker detection
+        monkeypatch.setattr("ralph_swarm.commands.status.get_running_workers", set)
+
+    return install
+
+
+@pytest.fixture(scope="session")
+def runner() -> Iterator[CliRunner]:
+    """One CliRunner for the session; each invoke isolates its own output.
+
+    The shared console is built at import time, so color is switched off on
+    it directly to keep assertions matching plain text.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(console, "no_color", True)
+        yield CliRunner()
@@ -0,0 +1,89 @@
+"""Tests for the shared beads client."""
+
+import json
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from ralph_swarm.beads import BeadsClient, get_beads_summary
+
+ISSUES = [
+    {"id": "a-1", "status": "open"},
+    {"id": "a-2", "status": "in_progress"},
+    {"id": "a-3", "status": "closed"},
+    {"id": "a-4"},
+]
+
+
+class TestBeadsClient:
+    """Tests for BeadsClient query caching."""
+
+    def test_ready_parses_json(self, tmp_path: Path) -> None:
+        """Should return the parsed issue list."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=0, stdout=json.dumps([{"id": "a"}]))
+            assert BeadsClient(tmp_path).ready() == [{"id": "a"}]
+            assert mock_run.call_args[0][0] == ["bd", "ready", "--json"]
+
+    def test_ready_unassigned(self, tmp_path: Path) -> None:
+        """Should ask bd to filter out assigned issues."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=0, stdout="[]")
+            BeadsClient(tmp_path).ready(unassigned=True)
+            assert mock_run.call_args[0][0] == ["bd", "ready", "--unassigned", "--json"]
+
+    def test_list_with_status(self, tmp_path: Path) -> None:
+        """Should pass the status filter through to bd."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=0, stdout="[]")
+            assert BeadsClient(tmp_path).list(status="in_progress") == []
+            assert mock_run.call_args[0][0] == ["bd", "list", "--status", "in_progress", "--json"]
+
+    def test_failure_returns_none(self, tmp_path: Path) -> None:
+        """Should return None when bd fails or emits invalid JSON."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=1, stdout="")
+            assert BeadsClient(tmp_path).ready() is None
+
+            mock_run.return_value = Mock(returncode=0, stdout="not valid json")
+            assert BeadsClient(tmp_path).ready() is None
+
+    def test_repeated_query_is_cached(self, tmp_path: Path) -> None:
+        """Queries within the TTL should share one bd invocation."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=0, stdout="[]")
+            client = BeadsClient(tmp_path, ttl=60)
+            client.ready()
+            client.ready()
+            assert mock_run.call_count == 1
+
+            client.invalidate()
+            client.ready()
+            assert mock_run.call_count == 2
+
+    def test_zero_ttl_disables_cache(self, tmp_path: Path) -> None:
+        """A zero TTL should re-run bd on every query."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=0, stdout="[]")
+            client = BeadsClient(tmp_path, ttl=0)
+            client.ready()
+            client.ready()
+            assert mock_run.call_count == 2
+
+
+class TestGetBeadsSummary:
+    """Tests for get_beads_summary."""
+
+    def test_counts_statuses(self, tmp_path: Path) -> None:
+        """Should count issues by status, treating missing status as open."""
+        (tmp_path / ".beads").mkdir()
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=0, stdout=json.dumps(ISSUES))
+            summary = get_beads_summary(tmp_path)
+
+        assert summary == {"total": 4, "open": 2, "in_progress": 1, "closed": 1}
+
+    def test_bd_failure_returns_empty(self, tmp_path: Path) -> None:
+        """Should return an empty summary when bd fails."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=1, stdout="")
+            assert get_beads_summary(tmp_path) == {}
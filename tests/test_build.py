@@ -1,10 +1,26 @@
 """Tests for the build command."""
 
 import json
+import multiprocessing
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-from ralph_swarm.commands.build import get_work_status
+from ralph_swarm.commands.build import (
+    ACTIVE_INTERVAL,
+    IDLE_INTERVAL,
+    MAX_IDLE_INTERVAL,
+    _idle_interval,
+    _init_swarm_worker,
+    _jittered,
+    _pace,
+    claim_next_issue,
+    get_work_status,
+    run_single_worker_loop,
+    stop_workers,
+)
 
 
 class TestGetWorkStatus:
@@ -183,6 +199,137 @@ class TestGetWorkStatus:
             assert status["unassigned"] == 1
 
 
+class TestClaimNextIssue:
+    """Tests for claim_next_issue with racing workers."""
+
+    def _mock_bd(self, ready: list[dict], owners: dict[str, str]):
+        """Mock bd where `show` reports the final owner of each issue."""
+        updates: list[str] = []
+
+        def mock_run(cmd, *args, **kwargs):
+            if cmd[1] == "ready":
+                return Mock(returncode=0, stdout=json.dumps(ready))
+            if cmd[1] == "update":
+                updates.append(cmd[2])
+                return Mock(returncode=0, stdout=b"")
+            if cmd[1] == "show":
+                issue_id = cmd[2]
+                return Mock(
+                    returncode=0,
+                    stdout=json.dumps([{"id": issue_id, "assignee": owners.get(issue_id)}]),
+                )
+            raise AssertionError(f"unexpected command: {cmd}")
+
+        return mock_run, updates
+
+    def test_claims_first_unassigned(self, tmp_path: Path) -> None:
+        """Should skip assigned issues and claim the first free one."""
+        ready = [
+            {"id": "issue-1", "assignee": "ralph-2"},
+            {"id": "issue-2", "assignee": None},
+        ]
+        mock_run, updates = self._mock_bd(ready, {"issue-2": "ralph-1"})
+        with patch("subprocess.run", side_effect=mock_run):
+            assert claim_next_issue(tmp_path, "ralph-1") == ("issue-2", False)
+        assert updates == ["issue-2"]
+
+    def test_lost_race_moves_to_next_candidate(self, tmp_path: Path) -> None:
+        """Losing a claim should try the next issue without re-polling."""
+        ready = [{"id": "issue-1"}, {"id": "issue-2"}]
+        mock_run, updates = self._mock_bd(ready, {"issue-1": "ralph-2", "issue-2": "ralph-1"})
+        with patch("subprocess.run", side_effect=mock_run):
+            assert claim_next_issue(tmp_path, "ralph-1") == ("issue-2", True)
+        assert updates == ["issue-1", "issue-2"]
+
+    def test_no_work_returns_none(self, tmp_path: Path) -> None:
+        """Should return None when nothing is claimable."""
+        mock_run, updates = self._mock_bd([{"id": "issue-1", "assignee": "ralph-2"}], {})
+        with patch("subprocess.run", side_effect=mock_run):
+            assert claim_next_issue(tmp_path, "ralph-1") == (None, False)
+        assert updates == []
+
+    def test_losing_every_race_is_contended(self, tmp_path: Path) -> None:
+        """Losing every claim should be reported apart from having no work."""
+        ready = [{"id": "issue-1"}, {"id": "issue-2"}]
+        mock_run, updates = self._mock_bd(ready, {"issue-1": "ralph-2", "issue-2": "ralph-3"})
+        with patch("subprocess.run", side_effect=mock_run):
+            assert claim_next_issue(tmp_path, "ralph-1") == (None, True)
+        assert updates == ["issue-1", "issue-2"]
+
+    def test_worker_loop_does_not_idle_on_lost_races(self, tmp_path: Path) -> None:
+        """Lost races should neither count toward idle_limit nor back off."""
+        claims = [(None, True), (None, True), (None, False)]
+        with (
+            patch("ralph_swarm.commands.build.claim_next_issue", side_effect=claims),
+            patch("ralph_swarm.commands.build._pace") as pace,
+        ):
+            run_single_worker_loop("ralph-1", "opus", False, False, True, 1, tmp_path, None)
+
+        # Two quick retries, then a single idle poll hits idle_limit=1 and shuts down
+        assert pace.call_count == 2
+        assert all(call.args[1] <= ACTIVE_INTERVAL * 1.5 for call in pace.call_args_list)
+
+
+class TestPace:
+    """Tests for worker loop pacing."""
+
+    def test_sleeps_only_the_remainder(self) -> None:
+        """Time already spent in the iteration should count toward the interval."""
+        with patch("time.monotonic", return_value=101.5), patch("time.sleep") as sleep:
+            _pace(100.0, 2.0)
+        sleep.assert_called_once_with(0.5)
+
+    def test_slow_iteration_does_not_sleep(self) -> None:
+        """An iteration longer than the interval should not sleep at all."""
+        with patch("time.monotonic", return_value=110.0), patch("time.sleep") as sleep:
+            _pace(100.0, 2.0)
+        sleep.assert_not_called()
+
+    def test_jitter_stays_within_half_interval(self) -> None:
+        """Jittered intervals should fall between base and 1.5x base."""
+        assert all(2.0 <= _jittered(2.0) <= 3.0 for _ in range(100))
+
+    def test_idle_backoff_never_exceeds_max(self) -> None:
+        """Jitter should not push the idle backoff past MAX_IDLE_INTERVAL."""
+        for idle_count in range(1, 10):
+            for _ in range(20):
+                assert IDLE_INTERVAL <= _idle_interval(idle_count) <= MAX_IDLE_INTERVAL
+
+    def test_idle_backoff_survives_long_idle_stretches(self) -> None:
+        """A worker idle for days should still get a capped interval, not an overflow."""
+        assert IDLE_INTERVAL <= _idle_interval(100_000) <= MAX_IDLE_INTERVAL
+
+
+class TestSwarmWorkerGroups:
+    """Tests for tracking and stopping swarm worker process groups."""
+
+    def test_workers_report_their_own_group(self) -> None:
+        """Each pool worker should lead its own group and report that pgid."""
+        pids = multiprocessing.Queue()
+        with ProcessPoolExecutor(
+            max_workers=1, initializer=_init_swarm_worker, initargs=(pids,)
+        ) as executor:
+            pgid = executor.submit(os.getpgid, 0).result()
+            assert pids.get(timeout=10) == pgid
+        assert pgid != os.getpgid(0)
+
+    def test_kills_groups_that_outlive_timeout(self) -> None:
+        """Groups that ignore SIGTERM should get SIGKILL; exited ones should not."""
+        sent: list[tuple[int, int]] = []
+
+        def killpg(pgid: int, sig: int) -> None:
+            sent.append((pgid, sig))
+            if pgid == 101 and sig == 0:
+                raise ProcessLookupError
+
+        with patch("os.killpg", side_effect=killpg), patch("time.sleep"):
+            stop_workers([101, 102], timeout=0.05)
+
+        assert (101, signal.SIGTERM) in sent
+        assert (102, signal.SIGKILL) in sent
+        assert (101, signal.SIGKILL) not in sent
+
+
 class TestBeadsShowResponse:
     """Tests for handling bd show responses (list vs dict)."""
 
@@ -237,102 +384,3 @@ class TestBeadsShowResponse:
 
         assert claimed_by is None
 
-
-class TestWorkerScriptLogic:
-    """Tests for worker script logic patterns."""
-
-    def test_jq_length_with_empty_array(self) -> None:
-        """Verify jq 'length' works with empty array."""
-        import subprocess
-
-        result = subprocess.run(
-            ["jq", "length"],
-            input="[]",
-            capture_output=True,
-            text=True,
-        )
-        assert result.stdout.strip() == "0"
-
-    def test_jq_length_with_single_item(self) -> None:
-        """Verify jq 'length' works with single item."""
-        import subprocess
-
-        result = subprocess.run(
-            ["jq", "length"],
-            input='[{"id": "test"}]',
-            capture_output=True,
-            text=True,
-        )
-        assert result.stdout.strip() == "1"
-
-    def test_jq_length_with_multiple_items(self) -> None:
-        """Verify jq 'length' works with multiple items."""
-        import subprocess
-
-        result = subprocess.run(
-            ["jq", "length"],
-            input='[{"id": "1"}, {"id": "2"}, {"id": "3"}]',
-            capture_output=True,
-            text=True,
-        )
-        assert result.stdout.strip() == "3"
-
-    def test_jq_extract_id_from_array(self) -> None:
-        """Verify jq can extract first ID from array."""
-        import subprocess
-
-        result = subprocess.run(
-            ["jq", "-r", ".[0].id // empty"],
-            input='[{"id": "issue-123"}]',
-            capture_output=True,
-            text=True,
-        )
-        assert result.stdout.strip() == "issue-123"
-
-    def test_jq_extract_id_from_empty_array(self) -> None:
-        """Verify jq handles empty array when extracting ID."""
-        import subprocess
-
-        result = subprocess.run(
-            ["jq", "-r", ".[0].id // empty"],
-            input="[]",
-            capture_output=True,
-            text=True,
-        )
-        assert result.stdout.strip() == ""
-
-    def test_jq_assignee_from_list(self) -> None:
-        """Verify jq can extract assignee from list response."""
-        import subprocess
-
-        result = subprocess.run(
-            ["jq", "-r", 'if type == "array" then .[0].assignee else .assignee end'],
-            input='[{"id": "issue-1", "assignee": "ralph-1"}]',
-            capture_output=True,
-            text=True,
-        )
-        assert result.stdout.strip() == "ralph-1"
-
-    def test_jq_assignee_from_dict(self) -> None:
-        """Verify jq can extract assignee from dict response."""
-        import subprocess
-
-        result = subprocess.run(
-            ["jq", "-r", 'if type == "array" then .[0].assignee else .assignee end'],
-            input='{"id": "issue-1", "assignee": "ralph-2"}',
-            capture_output=True,
-            text=True,
-        )
-        assert result.stdout.strip() == "ralph-2"
-
-    def test_jq_assignee_null_value(self) -> None:
-        """Verify jq handles null assignee."""
-        import subprocess
-
-        result = subprocess.run(
-            ["jq", "-r", 'if type == "array" then .[0].assignee else .assignee end'],
-            input='{"id": "issue-1", "assignee": null}',
-            capture_output=True,
-            text=True,
-        )
-        assert result.stdout.strip() == "null"
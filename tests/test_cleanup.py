@@ -0,0 +1,78 @@
+"""Tests for the cleanup command."""
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from ralph_swarm.commands import get_running_workers
+from ralph_swarm.commands.cleanup import reset_issues
+
+
+class TestResetIssues:
+    """Tests for reset_issues batching."""
+
+    def test_resets_all_issues_in_one_call(self, tmp_path: Path) -> None:
+        """Should update every issue with a single bd invocation."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=0)
+            reset_issues(tmp_path, ["a-1", "a-2", "a-3"])
+
+        assert mock_run.call_count == 1
+        assert mock_run.call_args[0][0] == [
+            "bd",
+            "update",
+            "a-1",
+            "a-2",
+            "a-3",
+            "--status",
+            "open",
+            "--assignee",
+            "",
+        ]
+
+    def test_falls_back_to_per_issue_updates(self, tmp_path: Path) -> None:
+        """Should update issues one by one if bd rejects the batch."""
+        calls: list[list[str]] = []
+
+        def mock_run(cmd, *args, **kwargs):
+            calls.append(cmd)
+            return Mock(returncode=1 if len(calls) == 1 else 0)
+
+        with patch("subprocess.run", side_effect=mock_run):
+            reset_issues(tmp_path, ["a-1", "a-2"])
+
+        assert len(calls) == 3
+        assert sorted(cmd[2] for cmd in calls[1:]) == ["a-1", "a-2"]
+
+
+class TestGetRunningWorkers:
+    """Tests for finding running workers by their BD_ACTOR environment."""
+
+    def test_reads_environments_from_proc(self, tmp_path: Path) -> None:
+        """Should collect BD_ACTOR from every readable process environment."""
+        for pid, environ in [
+            ("101", b"HOME=/root\0BD_ACTOR=worker-1\0"),
+            ("102", b"BD_ACTOR=worker-2\0PATH=/bin\0"),
+            ("103", b"HOME=/root\0"),
+        ]:
+            (tmp_path / pid).mkdir()
+            (tmp_path / pid / "environ").write_bytes(environ)
+        (tmp_path / "104").mkdir()  # Exited before its environ was read
+        (tmp_path / "self").mkdir()
+
+        assert get_running_workers(str(tmp_path)) == {"worker-1", "worker-2"}
+
+    def test_falls_back_to_ps_without_proc(self, tmp_path: Path) -> None:
+        """Should read environments from ps when /proc is missing."""
+        ps_output = "claude -p HOME=/Users/me BD_ACTOR=worker-3 TERM=xterm\nvim README.md\n"
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=0, stdout=ps_output)
+            workers = get_running_workers(str(tmp_path / "missing"))
+
+        assert workers == {"worker-3"}
+        assert "-E" in mock_run.call_args[0][0]
+
+    def test_returns_none_when_ps_fails(self, tmp_path: Path) -> None:
+        """Should report detection as unavailable rather than no workers."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=1, stdout="")
+            assert get_running_workers(str(tmp_path / "missing")) is None
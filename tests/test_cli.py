@@ -1,5 +1,8 @@
 """Tests for the main CLI."""
 
+from pathlib import Path
+
+import pytest
 from click.testing import CliRunner
 
 from ralph_swarm.cli import main
@@ -8,9 +11,8 @@ from ralph_swarm.cli import main
 class TestCLI:
     """Tests for the main CLI group."""
 
-    def test_help_shows_all_commands(self) -> None:
+    def test_help_shows_all_commands(self, runner: CliRunner) -> None:
         """Help should list all available commands."""
-        runner = CliRunner()
         result = runner.invoke(main, ["--help"])
 
         assert result.exit_code == 0
@@ -21,18 +23,39 @@ class TestCLI:
         assert "status" in result.output
         assert "cleanup" in result.output
 
-    def test_version_flag(self) -> None:
+    def test_version_flag(self, runner: CliRunner) -> None:
         """--version should show version."""
-        runner = CliRunner()
         result = runner.invoke(main, ["--version"])
 
         assert result.exit_code == 0
         assert "0.1.0" in result.output
 
-    def test_unknown_command_fails(self) -> None:
+    def test_unknown_command_fails(self, runner: CliRunner) -> None:
         """Unknown command should fail with helpful message."""
-        runner = CliRunner()
         result = runner.invoke(main, ["unknown"])
 
         assert result.exit_code != 0
         assert "No such command" in result.output
+
+    @pytest.mark.parametrize("relative", [".", "sub/myproject"])
+    def test_project_dir_is_resolved(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        bd_mock,
+        runner: CliRunner,
+        relative: str,
+    ) -> None:
+        """A relative --project-dir should reach commands as an absolute path."""
+        workdir = tmp_path / "myproject"
+        target = workdir / relative
+        (target / ".beads").mkdir(parents=True)
+        monkeypatch.chdir(workdir)
+        bd_mock([])
+
+        result = runner.invoke(main, ["-C", relative, "status"])
+
+        assert result.exit_code == 0
+        # The status panel is titled with the project directory's name,
+        # which is empty for an unresolved "."
+        assert "myproject" in result.output
@@ -2,7 +2,6 @@
 
 from pathlib import Path
 
-import pytest
 from click.testing import CliRunner
 
 from ralph_swarm.cli import main
@@ -43,41 +42,33 @@ class TestInitCommand:
     """Tests for the init CLI command."""
 
     def test_init_fails_when_already_initialized_beads(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, tmp_path: Path, runner: CliRunner
     ) -> None:
         """Init should fail if .beads exists."""
-        monkeypatch.chdir(tmp_path)
         (tmp_path / ".beads").mkdir()
 
-        runner = CliRunner()
-        result = runner.invoke(main, ["init"])
+        result = runner.invoke(main, ["init"], env={"RALPH_SWARM_PROJECT": str(tmp_path)})
 
         assert result.exit_code == 1
         assert "already initialized" in result.output
 
     def test_init_fails_when_already_initialized_claude_md(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, tmp_path: Path, runner: CliRunner
     ) -> None:
         """Init should fail if CLAUDE.md exists."""
-        monkeypatch.chdir(tmp_path)
         (tmp_path / "CLAUDE.md").write_text("# Existing")
 
-        runner = CliRunner()
-        result = runner.invoke(main, ["init"])
+        result = runner.invoke(main, ["init"], env={"RALPH_SWARM_PROJECT": str(tmp_path)})
 
         assert result.exit_code == 1
         assert "already initialized" in result.output
 
-    def test_init_shows_removal_instructions(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_init_shows_removal_instructions(self, tmp_path: Path, runner: CliRunner) -> None:
         """Init should show how to remove existing files."""
-        monkeypatch.chdir(tmp_path)
         (tmp_path / ".beads").mkdir()
         (tmp_path / "CLAUDE.md").write_text("# Existing")
 
-        runner = CliRunner()
-        result = runner.invoke(main, ["init"])
+        result = runner.invoke(main, ["init"], env={"RALPH_SWARM_PROJECT": str(tmp_path)})
 
         assert "rm -rf .beads" in result.output
         assert "rm CLAUDE.md" in result.output
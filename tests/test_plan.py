@@ -0,0 +1,108 @@
+"""Tests for the plan command."""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from ralph_swarm.cli import main
+from ralph_swarm.prompts import load_prompt
+
+ISSUES = [
+    {"id": "a-1", "status": "open"},
+    {"id": "a-2", "status": "in_progress"},
+    {"id": "a-3", "status": "closed"},
+    {"id": "a-4"},
+]
+
+# Canned subprocess.run results, built once rather than as a Mock per call
+CLAUDE_RESULT = SimpleNamespace(returncode=0, stdout="planned", stderr="")
+EMPTY_LIST_RESULT = SimpleNamespace(returncode=0, stdout=b"[]", stderr=b"")
+LIST_FAILED_RESULT = SimpleNamespace(returncode=1, stdout=b"", stderr=b"bd: database locked")
+READY_RESULT = SimpleNamespace(returncode=0, stdout=b"a-1 ready\n", stderr=b"")
+
+
+class TestPlanCommand:
+    """Tests for the plan command."""
+
+    def test_prompt_sent_on_stdin(self, tmp_path: Path, runner: CliRunner) -> None:
+        """The planning prompt should go to claude on stdin, not in argv."""
+        (tmp_path / "CLAUDE.md").write_text("# Project")
+        (tmp_path / ".beads").mkdir()
+
+        claude_calls = []
+
+        def mock_run(cmd, *args, **kwargs):
+            if cmd[0] == "claude":
+                claude_calls.append((cmd, kwargs))
+                return CLAUDE_RESULT
+            return EMPTY_LIST_RESULT
+
+        with patch("subprocess.run", side_effect=mock_run):
+            result = runner.invoke(main, ["plan"], env={"RALPH_SWARM_PROJECT": str(tmp_path)})
+
+        assert result.exit_code == 0
+        assert len(claude_calls) == 1
+        cmd, kwargs = claude_calls[0]
+        prompt = load_prompt("system/plan")
+        assert kwargs["input"] == prompt
+        assert prompt not in cmd
+
+    def test_shows_created_and_ready_issues(self, tmp_path: Path, runner: CliRunner) -> None:
+        """Should report new issues and print bd's ready list after planning."""
+        (tmp_path / "CLAUDE.md").write_text("# Project")
+        (tmp_path / ".beads").mkdir()
+
+        lists = iter(
+            [
+                EMPTY_LIST_RESULT,
+                SimpleNamespace(returncode=0, stdout=json.dumps(ISSUES).encode(), stderr=b""),
+            ]
+        )
+
+        bd_calls: list[tuple[list[str], dict]] = []
+
+        def mock_run(cmd, *args, **kwargs):
+            if cmd[0] == "claude":
+                return CLAUDE_RESULT
+            bd_calls.append((cmd, kwargs))
+            if cmd[1] == "list":
+                return next(lists)
+            return READY_RESULT
+
+        with patch("subprocess.run", side_effect=mock_run):
+            result = runner.invoke(main, ["plan"], env={"RALPH_SWARM_PROJECT": str(tmp_path)})
+
+        assert result.exit_code == 0
+        assert "Created 4 new issue(s)" in result.output
+        assert "Ready issues:" in result.output
+        # bd ready runs last, on the inherited stdout so it keeps its colors
+        ready_cmd, ready_kwargs = bd_calls[-1]
+        assert ready_cmd == ["bd", "ready"]
+        assert "stdout" not in ready_kwargs
+        assert "capture_output" not in ready_kwargs
+
+    def test_skips_ready_when_bd_list_fails(self, tmp_path: Path, runner: CliRunner) -> None:
+        """Should not run bd ready after planning if bd list is failing."""
+        (tmp_path / "CLAUDE.md").write_text("# Project")
+        (tmp_path / ".beads").mkdir()
+
+        lists = iter([EMPTY_LIST_RESULT, LIST_FAILED_RESULT])
+        bd_commands: list[str] = []
+
+        def mock_run(cmd, *args, **kwargs):
+            if cmd[0] == "claude":
+                return CLAUDE_RESULT
+            bd_commands.append(cmd[1])
+            if cmd[1] == "list":
+                return next(lists)
+            return READY_RESULT
+
+        with patch("subprocess.run", side_effect=mock_run):
+            result = runner.invoke(main, ["plan"], env={"RALPH_SWARM_PROJECT": str(tmp_path)})
+
+        assert result.exit_code == 0
+        assert "ready" not in bd_commands
+        assert "Ready issues:" not in result.output
@@ -1,8 +1,11 @@
 """Tests for the prompts module."""
 
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
 
-from ralph_swarm.prompts import load_prompt, load_prompt_with_vars
+from ralph_swarm.prompts import _load_template, load_prompt, load_prompt_with_vars
 
 
 class TestLoadPrompt:
@@ -34,9 +37,18 @@ class TestLoadPrompt:
 
     def test_load_nonexistent_prompt_raises(self) -> None:
         """Should raise FileNotFoundError for missing prompt."""
-        with pytest.raises(FileNotFoundError):
+        with pytest.raises(FileNotFoundError, match="Prompt not found: nonexistent"):
             load_prompt("nonexistent")
 
+    def test_template_read_once(self) -> None:
+        """Repeated loads should be served from the cache."""
+        _load_template.cache_clear()
+        with patch.object(Path, "read_text", return_value="cached") as mock_read:
+            assert load_prompt("system/plan") == "cached"
+            assert load_prompt("system/plan") == "cached"
+        _load_template.cache_clear()
+        assert mock_read.call_count == 1
+
 
 class TestLoadPromptWithVars:
     """Tests for load_prompt_with_vars function."""
@@ -59,3 +71,11 @@ class TestLoadPromptWithVars:
         prompt = load_prompt_with_vars("system/build", worker_id="ralph-1")
         assert "# Ralph Build Mode" in prompt
         assert "bd prime" in prompt
+
+    def test_substituted_values_are_not_rescanned(self) -> None:
+        """Values should be inserted verbatim, not scanned for more placeholders."""
+        _load_template.cache_clear()
+        with patch.object(Path, "read_text", return_value="{a} and {b}"):
+            prompt = load_prompt_with_vars("system/plan", a="{b}", b="x")
+        _load_template.cache_clear()
+        assert prompt == "{b} and x"
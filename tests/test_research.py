@@ -0,0 +1,56 @@
+"""Tests for the research command."""
+
+from pathlib import Path
+
+from ralph_swarm.commands.research import get_research_status, slugify
+
+
+class TestSlugify:
+    """Tests for slugify."""
+
+    def test_lowercases_and_hyphenates(self) -> None:
+        """Should lowercase and join words with hyphens."""
+        assert slugify("State Management") == "state-management"
+
+    def test_collapses_separators(self) -> None:
+        """Runs of spaces, underscores and hyphens become one hyphen."""
+        assert slugify("auth  __ -- libraries") == "auth-libraries"
+
+    def test_drops_other_characters(self) -> None:
+        """Punctuation and non-ASCII letters are removed, not hyphenated."""
+        assert slugify("C++ & Rust (2024) café") == "c-rust-2024-caf"
+
+    def test_strips_edge_hyphens(self) -> None:
+        """Leading and trailing separators are stripped."""
+        assert slugify("  _MCP servers!- ") == "mcp-servers"
+        assert slugify("---") == ""
+
+
+class TestGetResearchStatus:
+    """Tests for get_research_status."""
+
+    def test_no_research_directory(self, tmp_path: Path) -> None:
+        """Should report a missing research directory."""
+        assert get_research_status(tmp_path) == {"exists": False, "files": []}
+
+    def test_lists_markdown_files_only(self, tmp_path: Path) -> None:
+        """Should list .md files and ignore other files and directories."""
+        research_dir = tmp_path / "docs" / "research"
+        research_dir.mkdir(parents=True)
+        (research_dir / "auth.md").write_text("# Auth")
+        (research_dir / "notes.txt").write_text("notes")
+        (research_dir / "drafts.md").mkdir()
+
+        status = get_research_status(tmp_path)
+        assert status["exists"] is True
+        assert status["files"] == ["auth.md"]
+
+    def test_callers_cannot_corrupt_cached_scan(self, tmp_path: Path) -> None:
+        """Changing a returned status should not affect later callers."""
+        research_dir = tmp_path / "docs" / "research"
+        research_dir.mkdir(parents=True)
+        (research_dir / "auth.md").write_text("# Auth")
+
+        get_research_status(tmp_path)["files"].append("bogus.md")
+
+        assert get_research_status(tmp_path)["files"] == ["auth.md"]
@@ -1,8 +1,9 @@
 """Tests for the specify command."""
 
+import os
 from pathlib import Path
+from unittest.mock import patch
 
-import pytest
 from click.testing import CliRunner
 
 from ralph_swarm.cli import main
@@ -62,6 +63,37 @@ class TestGetSpecStatus:
         assert status["has_v0"] is False
         assert len(status["files"]) == 2
 
+    def test_rescans_only_when_directory_changes(self, tmp_path: Path) -> None:
+        """Should reuse the last scan until a spec is added or removed."""
+        specs_dir = tmp_path / "specs"
+        specs_dir.mkdir()
+        (specs_dir / "overview.md").write_text("# Overview")
+
+        first = get_spec_status(tmp_path)
+        with patch("os.scandir") as scandir:
+            assert get_spec_status(tmp_path) == first
+        scandir.assert_not_called()
+
+        (specs_dir / "v0.md").write_text("# V0")
+        mtime = specs_dir.stat().st_mtime_ns + 1_000_000_000
+        os.utime(specs_dir, ns=(mtime, mtime))
+        status = get_spec_status(tmp_path)
+        assert status["has_v0"] is True
+        assert sorted(status["files"]) == ["overview.md", "v0.md"]
+
+    def test_callers_cannot_corrupt_cached_scan(self, tmp_path: Path) -> None:
+        """Changing a returned status should not affect later callers."""
+        specs_dir = tmp_path / "specs"
+        specs_dir.mkdir()
+        (specs_dir / "v0.md").write_text("# V0")
+
+        get_spec_status(tmp_path)["files"].append("bogus.md")
+        get_spec_status(tmp_path)["v0_files"].clear()
+
+        status = get_spec_status(tmp_path)
+        assert status["files"] == ["v0.md"]
+        assert status["v0_files"] == ["v0.md"]
+
 
 class TestBuildPriorArtSection:
     """Tests for build_prior_art_section function."""
@@ -92,65 +124,56 @@ class TestBuildPriorArtSection:
 class TestSpecifyCommand:
     """Tests for the specify CLI command."""
 
-    def test_specify_requires_claude_md(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_specify_requires_claude_md(self, empty_project: Path, runner: CliRunner) -> None:
         """Specify should fail without CLAUDE.md."""
-        monkeypatch.chdir(tmp_path)
-
-        runner = CliRunner()
-        result = runner.invoke(main, ["specify", "--dry-run"])
+        result = runner.invoke(
+            main, ["specify", "--dry-run"], env={"RALPH_SWARM_PROJECT": str(empty_project)}
+        )
 
         assert result.exit_code == 1
         assert "CLAUDE.md not found" in result.output
 
-    def test_specify_dry_run_initial(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_specify_dry_run_initial(self, project_dir: Path, runner: CliRunner) -> None:
         """Dry run should show initial prompt when no v0 exists (iterative mode)."""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / "CLAUDE.md").write_text("# Project")
-
-        runner = CliRunner()
         # Select iterative mode (option 1)
-        result = runner.invoke(main, ["specify", "--dry-run"], input="1\n")
+        result = runner.invoke(
+            main,
+            ["specify", "--dry-run"],
+            input="1\n",
+            env={"RALPH_SWARM_PROJECT": str(project_dir)},
+        )
 
         assert result.exit_code == 0
         assert "Initial V0" in result.output or "V0 Philosophy" in result.output
 
-    def test_specify_full_flag(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_specify_full_flag(self, project_dir: Path, runner: CliRunner) -> None:
         """--full flag should trigger full specification mode."""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / "CLAUDE.md").write_text("# Project")
-
-        runner = CliRunner()
-        result = runner.invoke(main, ["specify", "--dry-run", "--full"])
+        result = runner.invoke(
+            main, ["specify", "--dry-run", "--full"], env={"RALPH_SWARM_PROJECT": str(project_dir)}
+        )
 
         assert result.exit_code == 0
         assert "Full Specification" in result.output
 
-    def test_specify_interactive_full_mode(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_specify_interactive_full_mode(self, project_dir: Path, runner: CliRunner) -> None:
         """Selecting option 2 should trigger full specification mode."""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / "CLAUDE.md").write_text("# Project")
-
-        runner = CliRunner()
         # Select full mode (option 2)
-        result = runner.invoke(main, ["specify", "--dry-run"], input="2\n")
+        result = runner.invoke(
+            main,
+            ["specify", "--dry-run"],
+            input="2\n",
+            env={"RALPH_SWARM_PROJECT": str(project_dir)},
+        )
 
         assert result.exit_code == 0
         assert "Full Specification" in result.output
 
-    def test_specify_creates_specs_directory(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_specify_creates_specs_directory(self, project_dir: Path, runner: CliRunner) -> None:
         """Specify should create specs directory if missing."""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / "CLAUDE.md").write_text("# Project")
-
-        runner = CliRunner()
         # Use dry-run and --full to avoid interactive prompts
-        result = runner.invoke(main, ["specify", "--dry-run", "--full"])
+        result = runner.invoke(
+            main, ["specify", "--dry-run", "--full"], env={"RALPH_SWARM_PROJECT": str(project_dir)}
+        )
 
         assert result.exit_code == 0
-        assert (tmp_path / "specs").exists()
+        assert (project_dir / "specs").exists()